@@ -1,18 +1,302 @@
 """Parse character card data from Base64 encoded JSON."""
 
-import base64
+import codecs
+import dataclasses
 import json
-from typing import Optional, Dict, Any
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Any, Dict, List, Tuple
 
 from app.models.character_card import CharacterCard
+from app.utils.json_utils import loadJson
+
+try:
+    from pybase64 import b64decode  # SIMD-accelerated decoder
+except ImportError:  # Optional speedup; fall back to the standard library
+    from base64 import b64decode
+
+# Deletion table for whitespace embedded in Base64 payloads
+_WS_TABLE = str.maketrans("", "", " \t\r\n")
+
+# Shared decoder for recovering the first JSON value from payloads with trailing data
+_JSON_DECODER = json.JSONDecoder()
+
+# Marks a cache miss (None is a valid cached result for unparseable files)
+_MISS = object()
+
+# Process pool for bulk decoding (created on first parseBatch that needs it)
+_processPool: Optional[ProcessPoolExecutor] = None
+_processPoolLock = threading.Lock()
+
+
+def _decodeCard(base64Data: str, filePath: str) -> Optional[CharacterCard]:
+    """
+    Decode Base64 encoded JSON into CharacterCard without caching.
+    
+    Module-level so it can run in worker processes.
+    
+    Args:
+        base64Data: Base64 encoded JSON string
+        filePath: Path to the source PNG file
+    
+    Returns:
+        CharacterCard instance or None if parsing fails
+    """
+    try:
+        # Clean up base64 data (remove any whitespace/newlines in one pass)
+        cleanBase64 = base64Data.translate(_WS_TABLE)
+        
+        # Add padding if needed
+        padding = 4 - (len(cleanBase64) % 4)
+        if padding != 4:
+            cleanBase64 += "=" * padding
+        
+        # Decode Base64
+        try:
+            jsonBytes = b64decode(cleanBase64, validate=False)
+        except Exception:
+            # Try without padding fix
+            jsonBytes = b64decode(base64Data.strip(), validate=False)
+        
+        # orjson rejects a UTF-8 BOM; drop it so those cards stay on the fast path
+        if jsonBytes.startswith(codecs.BOM_UTF8):
+            jsonBytes = jsonBytes[len(codecs.BOM_UTF8):]
+        
+        # Parse JSON straight from the UTF-8 bytes (character cards are UTF-8 by spec)
+        try:
+            data = loadJson(jsonBytes)
+        except ValueError:
+            # Non-UTF-8 text or trailing garbage: take the slow path
+            data = _parseJsonText(jsonBytes)
+        
+        # Validate structure
+        if not isinstance(data, dict):
+            print(f"[WARNING] Invalid JSON structure in {filePath}: not a dict")
+            return None
+        
+        # Create CharacterCard (accept any valid structure)
+        return CharacterCard.fromJson(data, filePath)
+    
+    except json.JSONDecodeError as e:
+        print(f"[WARNING] JSON decode error in {filePath}: {e}")
+        return None
+    except Exception as e:
+        print(f"[WARNING] Failed to parse {filePath}: {e}")
+        return None
+
+def _parseJsonText(jsonBytes: bytes) -> Any:
+    """
+    Parse JSON bytes that the fast path rejected.
+    
+    Args:
+        jsonBytes: Decoded Base64 payload
+    
+    Returns:
+        Parsed JSON value
+    
+    Raises:
+        json.JSONDecodeError: If no valid JSON can be recovered
+    """
+    try:
+        jsonStr = jsonBytes.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        jsonStr = jsonBytes.decode("latin-1")
+    
+    # Parse JSON - handle "Extra data" errors by keeping the first complete value
+    try:
+        data = json.loads(jsonStr)
+    except json.JSONDecodeError as e:
+        if "Extra data" not in str(e):
+            raise
+        # raw_decode stops at the end of the first value and, unlike brace
+        # counting, handles braces inside string literals
+        start = len(jsonStr) - len(jsonStr.lstrip())
+        data, _end = _JSON_DECODER.raw_decode(jsonStr, start)
+    
+    return data
+
+
+def _parseOne(item: Tuple[str, str]) -> Optional[CharacterCard]:
+    """Process pool entry point: decode one (filePath, base64Data) pair."""
+    filePath, base64Data = item
+    return _decodeCard(base64Data, filePath)
+
+
+def _internTags(card: Optional[CharacterCard]) -> Optional[CharacterCard]:
+    """
+    Get a copy of a card whose tag strings are interned.
+    
+    The same few hundred tags repeat across thousands of cards, so this
+    collapses them to one shared str each. Done in the main process as
+    interning does not survive pickling from workers or the disk cache.
+    
+    Args:
+        card: CharacterCard instance or None
+    
+    Returns:
+        Card with interned tags (the same card if it has none), or None
+    """
+    if card is None or not card.tags:
+        return card
+    tags = tuple(sys.intern(tag) if isinstance(tag, str) else tag for tag in card.tags)
+    return dataclasses.replace(card, tags=tags)
+
+
+def _getProcessPool() -> ProcessPoolExecutor:
+    """Get the shared decode process pool, starting it on first use."""
+    global _processPool
+    with _processPoolLock:
+        if _processPool is None:
+            # Never fork: the pool is started from worker threads of a running Qt app,
+            # and a forked child could inherit locks held by other threads
+            _processPool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _processPool
 
 
 class CardParser:
     """Parse character card data from EXIF metadata."""
     
-    def __init__(self):
-        """Initialize card parser."""
-        self.cache: Dict[str, Optional[CharacterCard]] = {}
+    MAX_CARDS = 5000  # In-memory LRU capacity
+    PARALLEL_THRESHOLD = 32  # Smaller batches are decoded in-process
+    CACHE_VERSION = 4  # Bump when the table or the pickled CharacterCard layout changes
+    
+    def __init__(self, maxCards: int = MAX_CARDS, diskCacheFile: Optional[str] = None, useDiskCache: bool = True):
+        """
+        Initialize card parser.
+        
+        Args:
+            maxCards: Maximum number of parsed cards kept in memory
+            diskCacheFile: Path to the SQLite card cache (defaults to ~/.cache/charcardview/cards.sqlite)
+            useDiskCache: Whether to persist parsed cards between sessions
+        """
+        # filePath -> (mtime_ns, size, card); the stat fields validate hits
+        self.cache: "OrderedDict[str, Tuple[Optional[int], Optional[int], Optional[CharacterCard]]]" = OrderedDict()
+        self.maxCards = maxCards
+        self._cacheLock = threading.Lock()  # Cards may be parsed from several threads
+        
+        if diskCacheFile is None:
+            diskCacheFile = Path.home() / ".cache" / "charcardview" / "cards.sqlite"
+        self._diskCachePath = Path(diskCacheFile)
+        self._useDiskCache = useDiskCache
+        self._db: Optional[sqlite3.Connection] = None
+        self._dbLock = threading.Lock()
+    
+    def _getDb(self) -> Optional[sqlite3.Connection]:
+        """Open the disk cache on first use (None if disabled or unavailable)."""
+        if self._db is None and self._useDiskCache:
+            try:
+                self._diskCachePath.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self._diskCachePath), isolation_level=None, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                if db.execute("PRAGMA user_version").fetchone()[0] != self.CACHE_VERSION:
+                    db.execute("DROP TABLE IF EXISTS cards")
+                    db.execute(f"PRAGMA user_version={self.CACHE_VERSION}")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS cards "
+                    "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, pickle BLOB)"
+                )
+                self._db = db
+            except Exception as e:
+                print(f"[WARNING] Card cache unavailable: {e}")
+                self._useDiskCache = False
+        return self._db
+    
+    @staticmethod
+    def _fingerprint(filePath: str) -> Optional[Tuple[int, int]]:
+        """Get (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(filePath)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _remember(
+        self, filePath: str, fingerprint: Optional[Tuple[int, int]], card: Optional[CharacterCard]
+    ) -> Optional[CharacterCard]:
+        """Store a result in the in-memory LRU, evicting the oldest entries, and return the stored card."""
+        mtimeNs, size = fingerprint if fingerprint is not None else (None, None)
+        card = _internTags(card)
+        with self._cacheLock:
+            self.cache[filePath] = (mtimeNs, size, card)
+            self.cache.move_to_end(filePath)
+            while len(self.cache) > self.maxCards:
+                self.cache.popitem(last=False)
+        return card
+    
+    def _lookup(self, filePath: str, fingerprint: Optional[Tuple[int, int]]) -> Any:
+        """
+        Look up a parsed card in memory, then on disk.
+        
+        Entries only match while the file's mtime and size are unchanged, so
+        edited cards are re-parsed.
+        
+        Args:
+            filePath: Path to the source PNG file
+            fingerprint: Current (mtime_ns, size) of the file, from _fingerprint
+        
+        Returns:
+            Cached CharacterCard (or None for a known-bad file), or _MISS
+        """
+        with self._cacheLock:
+            entry = self.cache.get(filePath)
+            if entry is not None:
+                mtimeNs, size, card = entry
+                stored = (mtimeNs, size) if mtimeNs is not None else None
+                if stored == fingerprint:
+                    self.cache.move_to_end(filePath)
+                    return card
+        
+        if fingerprint is None:
+            return _MISS
+        
+        with self._dbLock:
+            db = self._getDb()
+            if db is None:
+                return _MISS
+            try:
+                row = db.execute(
+                    "SELECT mtime_ns, size, pickle FROM cards WHERE path = ?", (filePath,)
+                ).fetchone()
+                if row is None or (row[0], row[1]) != fingerprint:
+                    return _MISS
+                card = pickle.loads(row[2])
+            except Exception:
+                return _MISS
+        
+        return self._remember(filePath, fingerprint, card)
+    
+    def _store(
+        self, filePath: str, fingerprint: Optional[Tuple[int, int]], card: Optional[CharacterCard]
+    ) -> Optional[CharacterCard]:
+        """Store a parse result in memory and on disk, and return the stored card."""
+        card = self._remember(filePath, fingerprint, card)
+        
+        if fingerprint is None:
+            return card
+        
+        with self._dbLock:
+            db = self._getDb()
+            if db is None:
+                return card
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO cards (path, mtime_ns, size, pickle) VALUES (?, ?, ?, ?)",
+                    (filePath, fingerprint[0], fingerprint[1], pickle.dumps(card, pickle.HIGHEST_PROTOCOL))
+                )
+            except Exception:
+                pass
+        return card
     
     def parseBase64(self, base64Data: str, filePath: str) -> Optional[CharacterCard]:
         """
@@ -21,92 +305,57 @@ class CardParser:
         Args:
             base64Data: Base64 encoded JSON string
             filePath: Path to the source PNG file
-            
+        
         Returns:
             CharacterCard instance or None if parsing fails
         """
         # Check cache
-        if filePath in self.cache:
-            return self.cache[filePath]
+        fingerprint = self._fingerprint(filePath)
+        card = self._lookup(filePath, fingerprint)
+        if card is not _MISS:
+            return card
         
-        try:
-            # Clean up base64 data (remove any whitespace/newlines)
-            cleanBase64 = base64Data.strip().replace("\n", "").replace("\r", "")
-            
-            # Add padding if needed
-            padding = 4 - (len(cleanBase64) % 4)
-            if padding != 4:
-                cleanBase64 += "=" * padding
-            
-            # Decode Base64
-            try:
-                jsonBytes = base64.b64decode(cleanBase64)
-            except Exception:
-                # Try without padding fix
-                jsonBytes = base64.b64decode(base64Data.strip())
-            
-            # Try UTF-8 first, then other encodings
-            jsonStr = None
-            for encoding in ["utf-8", "utf-8-sig", "latin-1"]:
-                try:
-                    jsonStr = jsonBytes.decode(encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if jsonStr is None:
-                print(f"[WARNING] Could not decode {filePath}: encoding error")
-                self.cache[filePath] = None
-                return None
-            
-            # Parse JSON - handle "Extra data" errors by finding valid JSON
-            data = None
+        return self._store(filePath, fingerprint, _decodeCard(base64Data, filePath))
+    
+    def parseBatch(self, items: List[Tuple[str, str]]) -> Dict[str, Optional[CharacterCard]]:
+        """
+        Parse many cards, decoding cache misses in a process pool.
+        
+        Args:
+            items: (filePath, base64Data) pairs
+        
+        Returns:
+            Dictionary mapping file paths to CharacterCard (or None if parsing failed),
+            in input order
+        """
+        fingerprintOf = self._fingerprint
+        lookup = self._lookup
+        results: Dict[str, Any] = {}
+        pending = []
+        fingerprints = []
+        for filePath, base64Data in items:
+            fingerprint = fingerprintOf(filePath)
+            card = lookup(filePath, fingerprint)
+            results[filePath] = card
+            if card is _MISS:
+                pending.append((filePath, base64Data))
+                fingerprints.append(fingerprint)
+        
+        cards = None
+        if len(pending) >= self.PARALLEL_THRESHOLD:
             try:
-                data = json.loads(jsonStr)
-            except json.JSONDecodeError as e:
-                if "Extra data" in str(e):
-                    # Try to find where valid JSON ends
-                    # The error gives us the position of extra data
-                    try:
-                        # Parse up to the error position
-                        validJson = jsonStr[:e.pos]
-                        # Find the last complete JSON object
-                        braceCount = 0
-                        lastValidEnd = 0
-                        for i, char in enumerate(validJson):
-                            if char == '{':
-                                braceCount += 1
-                            elif char == '}':
-                                braceCount -= 1
-                                if braceCount == 0:
-                                    lastValidEnd = i + 1
-                        if lastValidEnd > 0:
-                            data = json.loads(jsonStr[:lastValidEnd])
-                    except Exception:
-                        pass
-                
-                if data is None:
-                    raise e
-            
-            # Validate structure
-            if not isinstance(data, dict):
-                print(f"[WARNING] Invalid JSON structure in {filePath}: not a dict")
-                self.cache[filePath] = None
-                return None
-            
-            # Create CharacterCard (accept any valid structure)
-            card = CharacterCard.fromJson(data, filePath)
-            self.cache[filePath] = card
-            return card
+                chunkSize = max(1, len(pending) // (4 * (os.cpu_count() or 1)))
+                cards = list(_getProcessPool().map(_parseOne, pending, chunksize=chunkSize))
+            except Exception as e:
+                print(f"[WARNING] Parallel parsing failed, parsing serially: {e}")
+        if cards is None:
+            cards = [_parseOne(item) for item in pending]
         
-        except json.JSONDecodeError as e:
-            print(f"[WARNING] JSON decode error in {filePath}: {e}")
-            self.cache[filePath] = None
-            return None
-        except Exception as e:
-            print(f"[WARNING] Failed to parse {filePath}: {e}")
-            self.cache[filePath] = None
-            return None
+        # Merge into the caches here, in the calling process
+        for (filePath, _), fingerprint, card in zip(pending, fingerprints, cards):
+            results[filePath] = self._store(filePath, fingerprint, card)
+        
+        return results
     
     def parseFile(self, filePath: str, base64Data: Optional[str] = None) -> Optional[CharacterCard]:
         """
@@ -115,14 +364,22 @@ class CardParser:
         Args:
             filePath: Path to PNG file
             base64Data: Optional pre-extracted Base64 data
-            
+        
         Returns:
             CharacterCard instance or None if parsing fails
         """
+        # A cache hit skips the EXIF extraction as well as the decode
+        card = self._lookup(filePath, self._fingerprint(filePath))
+        if card is not _MISS:
+            return card
+        
         if base64Data is None:
             from app.core.exif_extractor import ExifExtractor
             extractor = ExifExtractor()
-            base64Data = extractor.extractFromFile(filePath)
+            try:
+                base64Data = extractor.extractFromFile(filePath)
+            finally:
+                extractor.close()
         
         if base64Data is None:
             return None
@@ -130,6 +387,7 @@ class CardParser:
         return self.parseBase64(base64Data, filePath)
     
     def clearCache(self):
-        """Clear the parsing cache."""
-        self.cache.clear()
+        """Clear the in-memory parsing cache (the disk cache is kept)."""
+        with self._cacheLock:
+            self.cache.clear()
 
@@ -1,21 +1,31 @@
 """EXIF data extraction using exiftool."""
 
+import atexit
 import subprocess
 import json
-import tempfile
 import os
+import struct
 import sys
-from typing import Dict, Optional, List, Callable
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, List, Callable, Iterator
 from pathlib import Path
 
+from app.utils.json_utils import loadJson
+
 # Windows-specific flag to hide console window
 SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
 
 class ExifExtractor:
     """Extract EXIF data from PNG files using exiftool."""
     
     BATCH_SIZE = 100  # Process files in batches
+    TAGS = ["chara", "Ccv3"]  # Primary tag first, then fallback
+    MAX_WORKERS = os.cpu_count() or 1  # Parallel exiftool processes
     
     def __init__(self, exiftoolPath: Optional[str] = None):
         """
@@ -24,7 +34,24 @@ class ExifExtractor:
         Args:
             exiftoolPath: Optional path to exiftool executable
         """
-        self.exiftoolPath = exiftoolPath or self._findExiftool()
+        self._exiftoolPath = exiftoolPath  # Looked up on first use (exiftool is only a fallback)
+        # Persistent exiftool processes are checked out per command, at most
+        # MAX_WORKERS at a time; idle ones wait in _idleProcesses for reuse
+        self._processes: List[subprocess.Popen] = []
+        self._idleProcesses: List[subprocess.Popen] = []
+        self._processSlots = threading.BoundedSemaphore(self.MAX_WORKERS)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def exiftoolPath(self) -> str:
+        """Path to the exiftool executable (found on first access)."""
+        if self._exiftoolPath is None:
+            path = self._findExiftool()
+            with self._lock:
+                if self._exiftoolPath is None:
+                    self._exiftoolPath = path
+        return self._exiftoolPath
     
     def _findExiftool(self) -> str:
         """Find exiftool in PATH or local directory."""
@@ -49,13 +76,208 @@ class ExifExtractor:
         # Fallback
         return "exiftool"
     
-    def _extractBatchJson(self, files: List[Path], tag: str) -> Dict[str, str]:
+    def _startProcess(self) -> subprocess.Popen:
+        """Start the persistent exiftool process (-stay_open mode)."""
+        # stderr is discarded: nothing reads it, and a full pipe would stall exiftool
+        return subprocess.Popen(
+            [self.exiftoolPath, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=SUBPROCESS_FLAGS
+        )
+    
+    def _checkoutProcess(self) -> subprocess.Popen:
+        """
+        Take an idle exiftool process, starting one if none is idle.
+        
+        Blocks while MAX_WORKERS processes are checked out. Every checkout
+        must be followed by _checkinProcess or _dropProcess.
+        """
+        self._processSlots.acquire()
+        try:
+            with self._lock:
+                while self._idleProcesses:
+                    process = self._idleProcesses.pop()
+                    if process.poll() is None:
+                        return process
+                    if process in self._processes:
+                        self._processes.remove(process)
+            
+            process = self._startProcess()
+            with self._lock:
+                if not self._processes:
+                    atexit.register(self.close)
+                self._processes.append(process)
+            return process
+        except BaseException:
+            self._processSlots.release()
+            raise
+    
+    def _checkinProcess(self, process: subprocess.Popen):
+        """Return a checked out exiftool process for reuse."""
+        with self._lock:
+            if process in self._processes:  # Not shut down by close() meanwhile
+                self._idleProcesses.append(process)
+        self._processSlots.release()
+    
+    def _dropProcess(self, process: subprocess.Popen):
+        """Forget and kill a broken checked out exiftool process."""
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+        self._killProcess(process)
+        self._processSlots.release()
+    
+    def _iterOutput(self, args: List[str]) -> Iterator[bytes]:
+        """
+        Run one command on a pooled persistent exiftool process.
+        
+        Lines are yielded as exiftool prints them. The output is always read up
+        to the {ready} marker, even if the caller stops iterating early, so the
+        process stays in sync for the next command.
+        
+        Args:
+            args: exiftool arguments, one per line of the argfile stanza
+            
+        Yields:
+            Raw output lines (everything before the {ready} marker)
+        """
+        process = self._checkoutProcess()
+        stanza = "\n".join(args) + "\n-execute\n"
+        ready = False
+        try:
+            process.stdin.write(stanza.encode("utf-8"))
+            process.stdin.flush()
+            
+            while True:
+                line = process.stdout.readline()
+                if not line:
+                    raise RuntimeError("exiftool process exited unexpectedly")
+                if line.rstrip() == b"{ready}":
+                    ready = True
+                    break
+                yield line
+            self._checkinProcess(process)
+        except GeneratorExit:
+            # Caller stopped early: drain the rest of this command's output
+            try:
+                while not ready:
+                    line = process.stdout.readline()
+                    if not line:
+                        raise RuntimeError("exiftool process exited unexpectedly")
+                    ready = line.rstrip() == b"{ready}"
+            except Exception:
+                self._dropProcess(process)
+            else:
+                self._checkinProcess(process)
+            raise
+        except Exception:
+            # Drop the broken process so the next command gets a fresh one
+            self._dropProcess(process)
+            raise
+    
+    def _runCommand(self, args: List[str]) -> bytes:
+        """
+        Run one command and collect its output.
+        
+        Args:
+            args: exiftool arguments, one per line of the argfile stanza
+            
+        Returns:
+            Raw command output (everything before the {ready} marker)
+        """
+        return b"".join(self._iterOutput(args))
+    
+    def _iterJsonRecords(self, args: List[str]) -> Iterator[dict]:
+        """
+        Run a -json command and yield its records as they arrive.
+        
+        exiftool prints one object per record, opening at column 0 with "{"
+        (or "[{" for the first) and closing with "}," / "}]". Each record is
+        parsed on its own, so only one record's text is buffered at a time.
+        
+        Args:
+            args: exiftool arguments (must include -json)
+            
+        Yields:
+            Parsed records
+        """
+        recordLines: List[bytes] = []
+        for line in self._iterOutput(args):
+            if not recordLines:
+                line = line.lstrip(b"[")  # The first record opens the array
+                if not line.strip():
+                    continue
+            recordLines.append(line)
+            
+            if line[:1] != b"}":
+                continue
+            
+            record = b"".join(recordLines).rstrip().rstrip(b",]")
+            recordLines = []
+            try:
+                try:
+                    item = loadJson(record)
+                except ValueError:
+                    # Not valid UTF-8: decode leniently like the text output path
+                    item = json.loads(record.decode("utf-8", errors="replace"))
+            except json.JSONDecodeError:
+                continue
+            if isinstance(item, dict):
+                yield item
+    
+    @staticmethod
+    def _killProcess(process: subprocess.Popen):
+        """Terminate an exiftool process without raising."""
+        try:
+            process.kill()
+            process.wait(timeout=5)
+        except Exception:
+            pass
+    
+    def _getExecutor(self) -> ThreadPoolExecutor:
+        """Get the batch worker pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_WORKERS,
+                    thread_name_prefix="exiftool"
+                )
+            return self._executor
+    
+    def close(self):
+        """Shut down the worker pool and all persistent exiftool processes."""
+        atexit.unregister(self.close)
+        with self._lock:
+            processes, self._processes = self._processes, []
+            self._idleProcesses = []
+            executor, self._executor = self._executor, None
+        
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        for process in processes:
+            if process.poll() is not None:
+                continue
+            try:
+                process.stdin.write(b"-stay_open\nFalse\n")
+                process.stdin.flush()
+                process.stdin.close()
+                process.wait(timeout=5)
+            except Exception:
+                self._killProcess(process)
+    
+    def _extractBatchJson(self, files: List[str], tags: List[str]) -> Dict[str, str]:
         """
         Extract EXIF data from a batch of files using JSON output.
         
+        All tags are requested in a single exiftool pass; the first populated
+        one (in list order) wins for each file.
+        
         Args:
             files: List of file paths
-            tag: EXIF tag to extract (e.g., "chara" or "Ccv3")
+            tags: EXIF tags to extract (e.g., ["chara", "Ccv3"])
             
         Returns:
             Dictionary mapping file paths to base64 data
@@ -65,66 +287,40 @@ class ExifExtractor:
         
         result = {}
         
+        # exiftool may echo paths back with different separators (and, on Windows,
+        # case), so map its SourceFile values back to our paths without touching disk
+        canonicalPaths = {os.path.normcase(os.path.normpath(file)): file for file in files}
+        
         try:
-            # Write file list to a temp file (handles Unicode filenames better)
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-                for file in files:
-                    f.write(str(file) + '\n')
-                argFile = f.name
+            # Use -json for structured output; file names go in the argfile stanza
+            args = ["-json"] + ["-" + tag for tag in tags] + [str(file) for file in files]
             
-            try:
-                # Use -json for structured output, -@ to read filenames from file
-                cmd = [
-                    self.exiftoolPath,
-                    "-json",
-                    "-" + tag,
-                    "-@", argFile
-                ]
+            # Records are streamed, so the batch's full JSON is never held in memory
+            for item in self._iterJsonRecords(args):
+                sourcePath = item.get("SourceFile", "")
+                # Try each tag, including its name variants
+                charaData = ""
+                for tag in tags:
+                    charaData = (
+                        item.get(tag.capitalize())
+                        or item.get(tag)
+                        or item.get(tag.lower())
+                        or item.get(tag.upper())
+                    )
+                    if charaData:
+                        break
                 
-                process = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    timeout=300,
-                    creationflags=SUBPROCESS_FLAGS
-                )
-                
-                if process.returncode == 0 and process.stdout.strip():
-                    try:
-                        jsonData = json.loads(process.stdout)
-                        for item in jsonData:
-                            sourcePath = item.get("SourceFile", "")
-                            # Try both tag name variants
-                            charaData = item.get(tag.capitalize(), item.get(tag, item.get(tag.upper(), "")))
-                            
-                            if sourcePath and charaData:
-                                # Normalize path
-                                filePath = Path(sourcePath)
-                                if filePath.exists():
-                                    normalizedPath = str(filePath.resolve())
-                                else:
-                                    normalizedPath = str(filePath)
-                                result[normalizedPath] = charaData
-                    except json.JSONDecodeError:
-                        pass
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(argFile)
-                except Exception:
-                    pass
+                if sourcePath and charaData:
+                    # Normalize path
+                    key = os.path.normcase(os.path.normpath(sourcePath))
+                    result[canonicalPaths.get(key, sourcePath)] = charaData
         
-        except subprocess.TimeoutExpired:
-            print(f"[WARNING] Batch extraction timed out for {len(files)} files")
         except Exception as e:
             print(f"[WARNING] Batch extraction error: {e}")
         
         return result
     
-    def _extractSingleFile(self, filePath: Path, tag: str) -> Optional[str]:
+    def _extractSingleFile(self, filePath: str, tag: str) -> Optional[str]:
         """
         Extract EXIF data from a single file.
         
@@ -136,32 +332,50 @@ class ExifExtractor:
             Base64 data or None
         """
         try:
-            cmd = [
-                self.exiftoolPath,
-                "-s3",
-                "-" + tag,
-                str(filePath)
-            ]
-            
-            process = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=30,
-                creationflags=SUBPROCESS_FLAGS
-            )
-            
-            if process.returncode == 0:
-                data = process.stdout.strip()
-                return data if data else None
+            output = self._runCommand(["-s3", "-" + tag, str(filePath)])
+            data = output.decode("utf-8", errors="replace").strip()
+            return data if data else None
         except Exception:
             pass
         
         return None
     
+    @staticmethod
+    def findPngFiles(directoryPath: str, recursive: bool = False) -> List[str]:
+        """
+        List PNG files in a directory.
+        
+        Args:
+            directoryPath: Path to directory
+            recursive: Whether to search subdirectories (hidden and symlinked ones are skipped)
+            
+        Returns:
+            Absolute paths of the PNG files found
+        """
+        pngFiles = []
+        pending = [os.path.realpath(directoryPath)]
+        
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if entry.name.lower().endswith(".png"):
+                                pngFiles.append(entry.path)
+                        # Symlinked directories are not descended into (like Path.rglob),
+                        # so a link back to an ancestor cannot loop
+                        elif recursive and entry.is_dir(follow_symlinks=False) and not entry.name.startswith("."):
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
+        
+        return pngFiles
+    
     def extractFromDirectory(
         self, 
         directoryPath: str,
@@ -180,16 +394,12 @@ class ExifExtractor:
             Dictionary mapping file paths to Base64 encoded EXIF data
         """
         result = {}
-        directory = Path(directoryPath)
         
-        if not directory.exists() or not directory.is_dir():
+        if not os.path.isdir(directoryPath):
             return result
         
         # Get PNG files
-        if recursive:
-            pngFiles = list(directory.rglob("*.png"))
-        else:
-            pngFiles = list(directory.glob("*.png"))
+        pngFiles = self.findPngFiles(directoryPath, recursive)
         
         if not pngFiles:
             return result
@@ -197,37 +407,98 @@ class ExifExtractor:
         totalFiles = len(pngFiles)
         processedFiles = 0
         
-        # Process files in batches using JSON output
-        for i in range(0, totalFiles, self.BATCH_SIZE):
-            batch = pngFiles[i:i + self.BATCH_SIZE]
-            
-            # Try primary tag (chara)
-            batchResult = self._extractBatchJson(batch, "chara")
-            result.update(batchResult)
-            
-            # Try fallback tag (Ccv3) for files without data
-            missingFiles = [f for f in batch if str(f.resolve()) not in result]
-            if missingFiles:
-                fallbackResult = self._extractBatchJson(missingFiles, "Ccv3")
-                for path, data in fallbackResult.items():
-                    if path not in result:
-                        result[path] = data
-            
-            # For any still missing, try individual extraction
-            stillMissing = [f for f in batch if str(f.resolve()) not in result]
-            for f in stillMissing:
-                data = self._extractSingleFile(f, "chara")
-                if not data:
-                    data = self._extractSingleFile(f, "Ccv3")
-                if data:
-                    result[str(f.resolve())] = data
-            
-            processedFiles += len(batch)
+        # Shrink batches for small folders so every worker gets a share
+        batchSize = max(1, min(self.BATCH_SIZE, -(-totalFiles // self.MAX_WORKERS)))
+        batches = [pngFiles[i:i + batchSize] for i in range(0, totalFiles, batchSize)]
+        
+        # Process batches in parallel, each on a pooled exiftool process.
+        # Results and progress are collected here, on the calling thread.
+        executor = self._getExecutor()
+        futures = {
+            executor.submit(self._extractBatchJson, batch, self.TAGS): len(batch)
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            result.update(future.result())
+            
+            processedFiles += futures[future]
             if progressCallback:
                 progressCallback(processedFiles, totalFiles)
         
         return result
     
+    @staticmethod
+    def _readPngTextChunk(filePath: str, keywords: List[str]) -> Optional[str]:
+        """
+        Read a text chunk straight from a PNG file, without exiftool.
+        
+        Only chunk headers are read for non-text chunks (their data is skipped
+        with a seek), so this touches a few KB even for large images. Text
+        chunks may come after IDAT, so the whole chunk list is walked.
+        
+        Args:
+            filePath: Path to PNG file
+            keywords: Chunk keywords in priority order (matched case-insensitively)
+            
+        Returns:
+            Text of the highest-priority keyword found, or None if the file has none
+            
+        Raises:
+            ValueError: If the file is not a well-formed PNG
+            OSError: If the file cannot be read
+        """
+        wanted = [keyword.lower().encode("latin-1") for keyword in keywords]
+        found = {}
+        
+        with open(filePath, "rb") as f:
+            if f.read(8) != PNG_SIGNATURE:
+                raise ValueError("not a PNG file")
+            
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError("truncated PNG file")
+                length, chunkType = struct.unpack(">I4s", header)
+                
+                if chunkType == b"IEND":
+                    break
+                
+                if chunkType not in (b"tEXt", b"zTXt", b"iTXt"):
+                    f.seek(length + 4, os.SEEK_CUR)  # Skip data and CRC
+                    continue
+                
+                data = f.read(length)
+                f.seek(4, os.SEEK_CUR)  # CRC
+                if len(data) < length:
+                    raise ValueError("truncated PNG file")
+                
+                keyword, _, rest = data.partition(b"\0")
+                keyword = keyword.lower()
+                if keyword not in wanted or keyword in found:
+                    continue
+                
+                if chunkType == b"tEXt":
+                    text = rest.decode("latin-1")
+                elif chunkType == b"zTXt":
+                    text = zlib.decompress(rest[1:]).decode("latin-1")
+                else:
+                    # iTXt: compression flag, method, language\0, translated keyword\0, text
+                    compressed = rest[:1] == b"\1"
+                    _language, _, rest = rest[2:].partition(b"\0")
+                    _translated, _, text = rest.partition(b"\0")
+                    if compressed:
+                        text = zlib.decompress(text)
+                    text = text.decode("utf-8")
+                
+                found[keyword] = text.strip()
+                if keyword == wanted[0]:
+                    break  # Highest priority, no need to read further
+        
+        for keyword in wanted:
+            if found.get(keyword):
+                return found[keyword]
+        return None
+    
     def extractFromFile(self, filePath: str) -> Optional[str]:
         """
         Extract EXIF data from a single PNG file.
@@ -238,15 +509,23 @@ class ExifExtractor:
         Returns:
             Base64 encoded EXIF data or None if not found
         """
-        file = Path(filePath)
-        if not file.exists() or not file.suffix.lower() == ".png":
+        if not filePath.lower().endswith(".png"):
+            return None
+        
+        # Read the PNG text chunks directly; exiftool is only needed if that fails.
+        # Opening the file doubles as the existence check (no separate stat call).
+        try:
+            return self._readPngTextChunk(filePath, self.TAGS)
+        except FileNotFoundError:
             return None
+        except Exception:
+            pass
         
         # Try primary tag
-        data = self._extractSingleFile(file, "chara")
+        data = self._extractSingleFile(filePath, "chara")
         if data:
             return data
         
         # Try fallback tag
-        data = self._extractSingleFile(file, "Ccv3")
+        data = self._extractSingleFile(filePath, "Ccv3")
         return data
@@ -1,13 +1,19 @@
 """Settings management and persistence."""
 
-import json
+import atexit
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
+from app.utils.json_utils import loadJson, dumpJson
+
 
 class SettingsManager:
     """Manage application settings."""
     
+    SAVE_DELAY = 0.5  # Seconds of quiet before pending changes are written
+    
     def __init__(self, settingsFile: Optional[str] = None):
         """
         Initialize settings manager.
@@ -20,13 +26,19 @@ class SettingsManager:
         
         self.settingsFile = Path(settingsFile)
         self.settings = self._loadSettings()
+        
+        # Setters only mark the settings dirty; a timer coalesces the writes
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        atexit.register(self._flush)
     
     def _loadSettings(self) -> dict:
         """Load settings from file."""
         if self.settingsFile.exists():
             try:
-                with open(self.settingsFile, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(self.settingsFile, "rb") as f:
+                    return loadJson(f.read())
             except Exception:
                 pass
         
@@ -37,11 +49,34 @@ class SettingsManager:
             "splitterPosition": [900, 300]  # Left, Right
         }
     
-    def _saveSettings(self):
-        """Save settings to file."""
+    def _markDirty(self):
+        """Schedule a save, restarting the debounce timer."""
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.SAVE_DELAY, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _flush(self):
+        """Save settings to file if there are pending changes."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            # Snapshot so the GUI thread can keep changing settings while we write
+            snapshot = dict(self.settings)
+        
+        # Write to a temp file and swap it in, so a crash mid-write
+        # never leaves a truncated settings file behind
+        tmpFile = self.settingsFile.with_suffix(".json.tmp")
         try:
-            with open(self.settingsFile, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=2)
+            tmpFile.write_bytes(dumpJson(snapshot))
+            os.replace(tmpFile, self.settingsFile)
         except Exception:
             pass
     
@@ -57,7 +92,7 @@ class SettingsManager:
             size: Thumbnail size in pixels
         """
         self.settings["thumbnailSize"] = max(50, min(500, size))
-        self._saveSettings()
+        self._markDirty()
     
     def getWindowGeometry(self) -> tuple:
         """Get window geometry (width, height)."""
@@ -76,7 +111,7 @@ class SettingsManager:
         """
         self.settings["windowWidth"] = width
         self.settings["windowHeight"] = height
-        self._saveSettings()
+        self._markDirty()
     
     def getSplitterPosition(self) -> list:
         """Get splitter position [left, right]."""
@@ -90,7 +125,7 @@ class SettingsManager:
             positions: List of [left, right] sizes
         """
         self.settings["splitterPosition"] = positions
-        self._saveSettings()
+        self._markDirty()
     
     def getLastFolder(self) -> Optional[str]:
         """Get last opened folder path."""
@@ -104,5 +139,5 @@ class SettingsManager:
             folderPath: Path to folder
         """
         self.settings["lastFolder"] = folderPath
-        self._saveSettings()
+        self._markDirty()
 
@@ -1,6 +1,6 @@
 """Character data display panel."""
 
-from typing import Optional
+from typing import Optional, Sequence
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QLabel, QPushButton, QHBoxLayout
 )
@@ -28,7 +28,7 @@ class DataPanel(QWidget):
         self._setupUi()
     
     def _setupUi(self):
-        """Set up the UI."""
+        """Set up the UI (all widgets are created once and reused for every card)."""
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 10, 10, 10)
         
@@ -44,27 +44,102 @@ class DataPanel(QWidget):
         self.contentLayout.setContentsMargins(10, 10, 10, 10)
         self.contentWidget.setLayout(self.contentLayout)
         
+        # Empty state
+        self.emptyLabel = QLabel("Select a character card to view details")
+        self.emptyLabel.setAlignment(Qt.AlignCenter)
+        self.emptyLabel.setStyleSheet("color: #888; font-size: 14px;")
+        self.contentLayout.addWidget(self.emptyLabel)
+        
+        # Name (header)
+        self.nameLabel = QLabel()
+        nameFont = QFont()
+        nameFont.setPointSize(18)
+        nameFont.setBold(True)
+        self.nameLabel.setFont(nameFont)
+        self.nameLabel.setWordWrap(True)
+        self.contentLayout.addWidget(self.nameLabel)
+        
+        # Tags
+        self._tagLabels: list[QLabel] = []
+        self.tagsContainer = QWidget()
+        self.tagsLayout = FlowLayout(margin=0, hSpacing=6, vSpacing=6)
+        self.tagsContainer.setLayout(self.tagsLayout)
+        self.contentLayout.addWidget(self.tagsContainer)
+        
+        # Text sections
+        self.descTitle, self.descLabel = self._addSection("Description")
+        self.personalityTitle, self.personalityLabel = self._addSection("Personality")
+        self.scenarioTitle, self.scenarioLabel = self._addSection("Scenario")
+        
+        # Greeting with navigation
+        self._addGreetingSection()
+        
+        # Add spacer
+        self.contentLayout.addStretch()
+        
         self.scrollArea.setWidget(self.contentWidget)
         layout.addWidget(self.scrollArea)
         
         self.setLayout(layout)
-        self._showEmptyState()
+        self._updateContent()
     
-    def _showEmptyState(self):
-        """Show empty state when no card is selected."""
-        self._clearContent()
-        
-        label = QLabel("Select a character card to view details")
-        label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet("color: #888; font-size: 14px;")
-        self.contentLayout.addWidget(label)
+    def _addSection(self, title: str) -> tuple[QLabel, QLabel]:
+        """
+        Add a section with title and content.
+        
+        Args:
+            title: Section title
+        
+        Returns:
+            The (title, content) labels
+        """
+        titleLabel = QLabel(title)
+        titleFont = QFont()
+        titleFont.setPointSize(12)
+        titleFont.setBold(True)
+        titleLabel.setFont(titleFont)
+        self.contentLayout.addWidget(titleLabel)
+        
+        contentLabel = QLabel()
+        contentLabel.setWordWrap(True)
+        contentLabel.setStyleSheet("padding: 5px;")
+        self.contentLayout.addWidget(contentLabel)
+        
+        return titleLabel, contentLabel
     
-    def _clearContent(self):
-        """Clear all content widgets."""
-        while self.contentLayout.count():
-            child = self.contentLayout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+    def _addGreetingSection(self):
+        """Add greeting section with navigation arrows."""
+        self.greetingTitle = QLabel("Greeting")
+        titleFont = QFont()
+        titleFont.setPointSize(12)
+        titleFont.setBold(True)
+        self.greetingTitle.setFont(titleFont)
+        self.contentLayout.addWidget(self.greetingTitle)
+        
+        # Navigation controls
+        navLayout = QHBoxLayout()
+        
+        self.prevButton = QPushButton("←")
+        self.prevButton.clicked.connect(lambda: self._navigateGreeting(-1))
+        navLayout.addWidget(self.prevButton)
+        
+        self.greetingLabel = QLabel()
+        self.greetingLabel.setWordWrap(True)
+        self.greetingLabel.setStyleSheet("padding: 5px;")
+        navLayout.addWidget(self.greetingLabel, 1)
+        
+        self.nextButton = QPushButton("→")
+        self.nextButton.clicked.connect(lambda: self._navigateGreeting(1))
+        navLayout.addWidget(self.nextButton)
+        
+        # Greeting counter
+        self.counterLabel = QLabel()
+        self.counterLabel.setStyleSheet("color: #888; font-size: 10px;")
+        navLayout.addWidget(self.counterLabel)
+        
+        self.greetingNav = QWidget()
+        self.greetingNav.setLayout(navLayout)
+        self.contentLayout.addWidget(self.greetingNav)
     
     def setCard(self, card: Optional[CharacterCard]):
         """
@@ -79,81 +154,73 @@ class DataPanel(QWidget):
     
     def _updateContent(self):
         """Update the displayed content."""
-        self._clearContent()
-        
-        if self.currentCard is None:
-            self._showEmptyState()
-            return
-        
         card = self.currentCard
+        hasCard = card is not None
+        
+        self.emptyLabel.setVisible(not hasCard)
+        self.nameLabel.setVisible(hasCard)
+        if not hasCard:
+            self.tagsContainer.hide()
+            for title, label in self._sectionLabels():
+                title.hide()
+                label.hide()
+            self.greetingTitle.hide()
+            self.greetingNav.hide()
+            return
         
         # Name (header)
-        nameLabel = QLabel(card.name)
-        nameFont = QFont()
-        nameFont.setPointSize(18)
-        nameFont.setBold(True)
-        nameLabel.setFont(nameFont)
-        nameLabel.setWordWrap(True)
-        self.contentLayout.addWidget(nameLabel)
+        self.nameLabel.setText(card.name)
         
         # Tags (if any)
-        if card.tags:
-            self._addTagsSection(card.tags)
-        
-        # Description
-        if card.description:
-            self._addSection("Description", card.description)
-        
-        # Personality
-        if card.personality:
-            self._addSection("Personality", card.personality)
+        self._setTags(card.tags)
         
-        # Scenario
-        if card.scenario:
-            self._addSection("Scenario", card.scenario)
+        # Description, personality, scenario
+        self._setSection(self.descTitle, self.descLabel, card.description)
+        self._setSection(self.personalityTitle, self.personalityLabel, card.personality)
+        self._setSection(self.scenarioTitle, self.scenarioLabel, card.scenario)
         
         # First message with navigation
-        if card.firstMes or card.alternateGreetings:
-            self._addGreetingSection(card)
-        
-        # Add spacer
-        self.contentLayout.addStretch()
+        hasGreeting = bool(card.firstMes or card.alternateGreetings)
+        self.greetingTitle.setVisible(hasGreeting)
+        self.greetingNav.setVisible(hasGreeting)
+        if hasGreeting:
+            self._updateGreeting()
+    
+    def _sectionLabels(self) -> list[tuple[QLabel, QLabel]]:
+        """Get the (title, content) label pairs of the text sections."""
+        return [
+            (self.descTitle, self.descLabel),
+            (self.personalityTitle, self.personalityLabel),
+            (self.scenarioTitle, self.scenarioLabel),
+        ]
     
-    def _addSection(self, title: str, content: str):
+    def _setSection(self, titleLabel: QLabel, contentLabel: QLabel, content: str):
         """
-        Add a section with title and content.
+        Fill a text section, hiding it when there is no content.
         
         Args:
-            title: Section title
+            titleLabel: Section title label
+            contentLabel: Section content label
             content: Section content
         """
-        titleLabel = QLabel(title)
-        titleFont = QFont()
-        titleFont.setPointSize(12)
-        titleFont.setBold(True)
-        titleLabel.setFont(titleFont)
-        self.contentLayout.addWidget(titleLabel)
-        
-        contentLabel = QLabel(content)
-        contentLabel.setWordWrap(True)
-        contentLabel.setStyleSheet("padding: 5px;")
-        self.contentLayout.addWidget(contentLabel)
+        visible = bool(content)
+        titleLabel.setVisible(visible)
+        contentLabel.setVisible(visible)
+        if visible:
+            contentLabel.setText(content)
     
-    def _addTagsSection(self, tags: list):
+    def _setTags(self, tags: Sequence[str]):
         """
-        Add tags section with styled tag badges.
+        Show tag badges, reusing existing badge labels.
         
         Args:
-            tags: List of tag strings
+            tags: Tag strings
         """
-        # Create a container with flow layout for wrapping tags
-        tagsContainer = QWidget()
-        tagsLayout = FlowLayout(margin=0, hSpacing=6, vSpacing=6)
-        
-        for tag in tags:
-            if not tag:
-                continue
-            tagLabel = QLabel(str(tag))
+        tags = [str(tag) for tag in tags if tag]
+        
+        # Create badges only when this card has more tags than any before it
+        while len(self._tagLabels) < len(tags):
+            tagLabel = QLabel()
             tagLabel.setStyleSheet("""
                 QLabel {
                     background-color: #3a6ea5;
@@ -163,53 +230,30 @@ class DataPanel(QWidget):
                     font-size: 11px;
                 }
             """)
-            tagsLayout.addWidget(tagLabel)
-        
-        tagsContainer.setLayout(tagsLayout)
-        self.contentLayout.addWidget(tagsContainer)
+            self.tagsLayout.addWidget(tagLabel)
+            self._tagLabels.append(tagLabel)
+        
+        for i, tagLabel in enumerate(self._tagLabels):
+            if i < len(tags):
+                tagLabel.setText(tags[i])
+                tagLabel.show()
+            else:
+                tagLabel.hide()
+        
+        self.tagsContainer.setVisible(bool(tags))
+        self.tagsLayout.invalidate()
     
-    def _addGreetingSection(self, card: CharacterCard):
-        """
-        Add greeting section with navigation arrows.
-        
-        Args:
-            card: CharacterCard instance
-        """
-        titleLabel = QLabel("Greeting")
-        titleFont = QFont()
-        titleFont.setPointSize(12)
-        titleFont.setBold(True)
-        titleLabel.setFont(titleFont)
-        self.contentLayout.addWidget(titleLabel)
-        
-        # Navigation controls
-        navLayout = QHBoxLayout()
-        
-        prevButton = QPushButton("←")
-        prevButton.setEnabled(self.currentGreetingIndex > 0)
-        prevButton.clicked.connect(lambda: self._navigateGreeting(-1))
-        navLayout.addWidget(prevButton)
-        
-        greetingLabel = QLabel(card.getCurrentGreeting(self.currentGreetingIndex))
-        greetingLabel.setWordWrap(True)
-        greetingLabel.setStyleSheet("padding: 5px;")
-        navLayout.addWidget(greetingLabel, 1)
+    def _updateGreeting(self):
+        """Update the greeting text, navigation buttons and counter."""
+        card = self.currentCard
+        greetingCount = card.getGreetingCount()
         
-        nextButton = QPushButton("→")
-        maxIndex = card.getGreetingCount() - 1
-        nextButton.setEnabled(self.currentGreetingIndex < maxIndex)
-        nextButton.clicked.connect(lambda: self._navigateGreeting(1))
-        navLayout.addWidget(nextButton)
+        self.greetingLabel.setText(card.getCurrentGreeting(self.currentGreetingIndex))
+        self.prevButton.setEnabled(self.currentGreetingIndex > 0)
+        self.nextButton.setEnabled(self.currentGreetingIndex < greetingCount - 1)
         
-        # Greeting counter
-        if card.getGreetingCount() > 1:
-            counterLabel = QLabel(f"{self.currentGreetingIndex + 1} / {card.getGreetingCount()}")
-            counterLabel.setStyleSheet("color: #888; font-size: 10px;")
-            navLayout.addWidget(counterLabel)
-        
-        navWidget = QWidget()
-        navWidget.setLayout(navLayout)
-        self.contentLayout.addWidget(navWidget)
+        self.counterLabel.setVisible(greetingCount > 1)
+        self.counterLabel.setText(f"{self.currentGreetingIndex + 1} / {greetingCount}")
     
     def _navigateGreeting(self, direction: int):
         """
@@ -226,5 +270,4 @@ class DataPanel(QWidget):
         
         if 0 <= newIndex <= maxIndex:
             self.currentGreetingIndex = newIndex
-            self._updateContent()
-
+            self._updateGreeting()
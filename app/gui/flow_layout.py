@@ -1,5 +1,6 @@
 """Flow layout widget for wrapping items like tags."""
 
+from typing import Optional
 from PySide6.QtWidgets import QLayout, QSizePolicy
 from PySide6.QtCore import Qt, QRect, QSize, QPoint
 
@@ -21,6 +22,8 @@ class FlowLayout(QLayout):
         self._hSpacing = hSpacing
         self._vSpacing = vSpacing
         self._items = []
+        self._heightForWidthCache: dict[int, int] = {}
+        self._cachedMin: Optional[QSize] = None
         
         if margin >= 0:
             self.setContentsMargins(margin, margin, margin, margin)
@@ -28,6 +31,7 @@ class FlowLayout(QLayout):
     def addItem(self, item):
         """Add an item to the layout."""
         self._items.append(item)
+        self._clearCaches()
     
     def horizontalSpacing(self) -> int:
         """Get horizontal spacing."""
@@ -50,6 +54,7 @@ class FlowLayout(QLayout):
     def takeAt(self, index: int):
         """Remove and return item at index."""
         if 0 <= index < len(self._items):
+            self._clearCaches()
             return self._items.pop(index)
         return None
     
@@ -62,8 +67,22 @@ class FlowLayout(QLayout):
         return True
     
     def heightForWidth(self, width: int) -> int:
-        """Calculate height for given width."""
-        return self._doLayout(QRect(0, 0, width, 0), True)
+        """Calculate height for given width (cached until the layout changes)."""
+        height = self._heightForWidthCache.get(width)
+        if height is None:
+            height = self._doLayout(QRect(0, 0, width, 0), True)
+            self._heightForWidthCache[width] = height
+        return height
+    
+    def _clearCaches(self):
+        """Drop cached size computations."""
+        self._heightForWidthCache.clear()
+        self._cachedMin = None
+    
+    def invalidate(self):
+        """Drop cached geometry when Qt invalidates the layout."""
+        self._clearCaches()
+        super().invalidate()
     
     def setGeometry(self, rect: QRect):
         """Set layout geometry."""
@@ -75,14 +94,18 @@ class FlowLayout(QLayout):
         return self.minimumSize()
     
     def minimumSize(self) -> QSize:
-        """Return minimum size."""
-        size = QSize()
-        for item in self._items:
-            size = size.expandedTo(item.minimumSize())
-        
-        margins = self.contentsMargins()
-        size += QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
-        return size
+        """Return minimum size (cached until the layout changes)."""
+        if self._cachedMin is None:
+            minimums = [item.minimumSize() for item in self._items if not item.isEmpty()]
+            width = max((size.width() for size in minimums), default=0)
+            height = max((size.height() for size in minimums), default=0)
+            
+            margins = self.contentsMargins()
+            self._cachedMin = QSize(
+                width + margins.left() + margins.right(),
+                height + margins.top() + margins.bottom()
+            )
+        return QSize(self._cachedMin)
     
     def _doLayout(self, rect: QRect, testOnly: bool) -> int:
         """
@@ -98,31 +121,37 @@ class FlowLayout(QLayout):
         margins = self.contentsMargins()
         effectiveRect = rect.adjusted(margins.left(), margins.top(), -margins.right(), -margins.bottom())
         
-        x = effectiveRect.x()
+        left = effectiveRect.x()
+        right = effectiveRect.right()
+        spaceX = self._hSpacing
+        spaceY = self._vSpacing
+        
+        x = left
         y = effectiveRect.y()
         lineHeight = 0
         
         for item in self._items:
             widget = item.widget()
-            if widget is None:
-                continue
+            if widget is None or item.isEmpty():
+                continue  # Skip hidden widgets (e.g. unused tag badges)
             
-            spaceX = self._hSpacing
-            spaceY = self._vSpacing
+            # sizeHint() can hit font metrics, so query it once per item
+            hint = item.sizeHint()
+            hintWidth = hint.width()
             
-            nextX = x + item.sizeHint().width() + spaceX
+            nextX = x + hintWidth + spaceX
             
-            if nextX - spaceX > effectiveRect.right() and lineHeight > 0:
-                x = effectiveRect.x()
+            if nextX - spaceX > right and lineHeight > 0:
+                x = left
                 y = y + lineHeight + spaceY
-                nextX = x + item.sizeHint().width() + spaceX
+                nextX = x + hintWidth + spaceX
                 lineHeight = 0
             
             if not testOnly:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QRect(QPoint(x, y), hint))
             
             x = nextX
-            lineHeight = max(lineHeight, item.sizeHint().height())
+            lineHeight = max(lineHeight, hint.height())
         
         return y + lineHeight - rect.y() + margins.bottom()
 
@@ -1,54 +1,130 @@
 """Loading overlay widget for blocking operations."""
 
+from typing import Optional
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtGui import QPainter, QColor, QPen, QPixmap
 
 
 class SpinnerWidget(QWidget):
     """Animated spinner widget."""
     
+    FPS = 8  # One segment per tick; plenty for a 12-step spinner
+    BACKGROUND_FPS = 4  # Used while the window is not active
+    SEGMENTS = 12
+    
     def __init__(self, parent=None):
         """Initialize spinner."""
         super().__init__(parent)
-        self._angle = 0
+        self._frame = 0
+        self._frames: list[QPixmap] = []
+        self._framesDpr = 0.0
+        self._running = False
+        self._paused = False
         self._timer = QTimer(self)
+        self._timer.setInterval(1000 // self.FPS)
         self._timer.timeout.connect(self._rotate)
         self.setFixedSize(50, 50)
+        
+        # Pens for each segment, fading in towards the leading one
+        self._pens = []
+        for i in range(self.SEGMENTS):
+            pen = QPen(QColor(70, 130, 180, int(255 * (i + 1) / self.SEGMENTS)))
+            pen.setWidth(3)
+            pen.setCapStyle(Qt.RoundCap)
+            self._pens.append(pen)
     
     def _rotate(self):
         """Rotate the spinner."""
-        self._angle = (self._angle + 30) % 360
+        self._frame = (self._frame + 1) % self.SEGMENTS
         self.update()
     
+    def _buildFrames(self, dpr: float):
+        """
+        Pre-render one pixmap per rotation step.
+        
+        Args:
+            dpr: Device pixel ratio to render at
+        """
+        size = min(self.width(), self.height())
+        center = size // 2
+        radius = size // 2 - 5
+        step = 360 / self.SEGMENTS
+        
+        self._frames = []
+        for frame in range(self.SEGMENTS):
+            pixmap = QPixmap(round(size * dpr), round(size * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.translate(center, center)
+            painter.rotate(frame * step)
+            for pen in self._pens:
+                painter.rotate(step)
+                painter.setPen(pen)
+                painter.drawLine(0, -radius + 10, 0, -radius)
+            painter.end()
+            
+            self._frames.append(pixmap)
+        self._framesDpr = dpr
+    
+    def setFps(self, fps: int):
+        """
+        Set the animation frame rate.
+        
+        Args:
+            fps: Frames per second
+        """
+        self._timer.setInterval(1000 // max(1, fps))
+    
     def start(self):
-        """Start the spinner animation."""
-        self._timer.start(50)
+        """Start the spinner animation (the timer only runs while visible)."""
+        self._running = True
+        self._updateTimer()
     
     def stop(self):
         """Stop the spinner animation."""
+        self._running = False
+        self._updateTimer()
+    
+    def setPaused(self, paused: bool):
+        """
+        Pause or resume a running animation, e.g. while the window is minimized.
+        
+        Args:
+            paused: True to pause
+        """
+        self._paused = paused
+        self._updateTimer()
+    
+    def _updateTimer(self):
+        """Run the timer only while the spinner is running, unpaused and visible."""
+        if self._running and not self._paused and self.isVisible():
+            if not self._timer.isActive():
+                self._timer.start()
+        else:
+            self._timer.stop()
+    
+    def showEvent(self, event):
+        """Resume animating when shown."""
+        super().showEvent(event)
+        self._updateTimer()
+    
+    def hideEvent(self, event):
+        """Stop animating while hidden."""
+        super().hideEvent(event)
         self._timer.stop()
     
     def paintEvent(self, event):
         """Paint the spinner."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        size = min(self.width(), self.height())
-        center = size // 2
-        radius = size // 2 - 5
-        
-        painter.translate(center, center)
-        painter.rotate(self._angle)
+        dpr = self.devicePixelRatioF()
+        if dpr != self._framesDpr:
+            self._buildFrames(dpr)
         
-        for i in range(12):
-            painter.rotate(30)
-            alpha = int(255 * (i + 1) / 12)
-            pen = QPen(QColor(70, 130, 180, alpha))
-            pen.setWidth(3)
-            pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(pen)
-            painter.drawLine(0, -radius + 10, 0, -radius)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._frames[self._frame])
 
 
 class LoadingOverlay(QWidget):
@@ -58,6 +134,10 @@ class LoadingOverlay(QWidget):
         """Initialize loading overlay."""
         super().__init__(parent)
         self._message = "Loading..."
+        self._bgPixmap: Optional[QPixmap] = None
+        
+        # paintEvent draws the whole background itself; nothing for Qt to clear first
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self._setupUi()
         self.hide()
     
@@ -68,6 +148,7 @@ class LoadingOverlay(QWidget):
         
         # Container for centered content
         self.container = QWidget()
+        self.container.setAttribute(Qt.WA_StyledBackground, True)
         self.container.setStyleSheet("""
             QWidget {
                 background-color: rgba(40, 40, 40, 220);
@@ -95,7 +176,9 @@ class LoadingOverlay(QWidget):
             }
         """)
         self.messageLabel.setAlignment(Qt.AlignCenter)
-        self.messageLabel.setMinimumWidth(170)
+        # Fixed width so changing the text (e.g. progress updates) needs no relayout
+        self.messageLabel.setFixedWidth(220)
+        self.messageLabel.setWordWrap(True)
         containerLayout.addWidget(self.messageLabel)
         
         layout.addWidget(self.container)
@@ -110,8 +193,6 @@ class LoadingOverlay(QWidget):
         """
         self._message = message
         self.messageLabel.setText(message)
-        self.messageLabel.adjustSize()
-        self.container.adjustSize()
     
     def showOverlay(self, message: str = "Loading..."):
         """
@@ -121,8 +202,13 @@ class LoadingOverlay(QWidget):
             message: Message to display
         """
         self.setMessage(message)
-        if self.parent():
-            self.setGeometry(self.parent().rect())
+        parent = self.parent()
+        if parent:
+            self.setGeometry(parent.rect())
+        
+        # Animate slower when the window is in the background
+        active = parent is None or parent.window().isActiveWindow()
+        self.spinner.setFps(SpinnerWidget.FPS if active else SpinnerWidget.BACKGROUND_FPS)
         self.spinner.start()
         self.show()
         self.raise_()
@@ -132,15 +218,25 @@ class LoadingOverlay(QWidget):
         self.spinner.stop()
         self.hide()
     
+    def _buildBackground(self):
+        """Render the semi-transparent background for the current size."""
+        self._bgPixmap = QPixmap(self.size())
+        self._bgPixmap.fill(Qt.transparent)
+        painter = QPainter(self._bgPixmap)
+        painter.fillRect(self._bgPixmap.rect(), QColor(0, 0, 0, 120))
+        painter.end()
+    
     def paintEvent(self, event):
         """Paint semi-transparent background."""
+        if self._bgPixmap is None or self._bgPixmap.size() != self.size():
+            self._buildBackground()
         painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 120))
-        super().paintEvent(event)
+        painter.drawPixmap(0, 0, self._bgPixmap)
     
     def resizeEvent(self, event):
         """Handle resize to match parent."""
         super().resizeEvent(event)
         if self.parent():
             self.setGeometry(self.parent().rect())
+        self._buildBackground()
 
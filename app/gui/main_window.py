@@ -1,13 +1,14 @@
 """Main application window."""
 
+import os
 from pathlib import Path
 from typing import Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QSplitter,
-    QFileDialog, QSlider, QLabel, QToolBar, QStatusBar, QPushButton
+    QApplication, QFileDialog, QSlider, QLabel, QToolBar, QStatusBar, QPushButton
 )
-from PySide6.QtCore import Qt, QThread, Signal, QObject
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtCore import Qt, Signal, QObject, QEvent, QRunnable, QThreadPool, QTimer
+from PySide6.QtGui import QAction, QIcon, QPixmapCache
 
 from app.models.character_card import CharacterCard
 from app.core.exif_extractor import ExifExtractor
@@ -15,33 +16,77 @@ from app.core.card_parser import CardParser
 from app.core.settings_manager import SettingsManager
 from app.gui.thumbnail_grid import ThumbnailGrid
 from app.gui.data_panel import DataPanel
-from app.gui.loading_overlay import LoadingOverlay
+from app.gui.loading_overlay import LoadingOverlay, SpinnerWidget
 
+# Window icon, loaded on first show so startup doesn't wait on the file system
+ICON_PATH = Path(__file__).resolve().parents[2] / "images" / "icon.ico"
 
-class ExifExtractionWorker(QObject):
-    """Worker thread for EXIF extraction."""
+
+class CardLoadSignals(QObject):
+    """Signals for ExtractParseTask (QRunnable cannot emit signals itself)."""
     
-    finished = Signal(dict)  # Emits {filePath: base64Data}
-    error = Signal(str)  # Emits error message
+    chunkFinished = Signal(int, int, list)  # Emits (generation, file count, [CharacterCard])
+
+
+class ExtractParseTask(QRunnable):
+    """Thread pool task that extracts and parses one chunk of PNG files."""
     
-    def __init__(self, directoryPath: str):
+    def __init__(
+        self,
+        generation: int,
+        filePaths: list[str],
+        extractor: ExifExtractor,
+        parser: CardParser,
+        signals: CardLoadSignals,
+        isCancelled
+    ):
         """
-        Initialize worker.
+        Initialize task.
         
         Args:
-            directoryPath: Path to directory containing PNG files
+            generation: Load generation the results belong to
+            filePaths: PNG files to process
+            extractor: Shared extractor
+            parser: Shared parser (its caches are thread-safe)
+            signals: Signal bridge to the GUI thread
+            isCancelled: Callable returning True once this load is stale
         """
         super().__init__()
-        self.directoryPath = directoryPath
+        self.generation = generation
+        self.filePaths = filePaths
+        self.extractor = extractor
+        self.parser = parser
+        self.signals = signals
+        self.isCancelled = isCancelled
     
-    def extract(self):
-        """Perform EXIF extraction."""
-        try:
-            extractor = ExifExtractor()
-            result = extractor.extractFromDirectory(self.directoryPath)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+    def run(self):
+        """Extract each file, parse the chunk, then report its cards."""
+        # Bind the per-file calls once; this loop runs for every PNG in the folder
+        extract = self.extractor.extractFromFile
+        isCancelled = self.isCancelled
+        items = []
+        for filePath in self.filePaths:
+            if isCancelled():
+                return
+            try:
+                base64Data = extract(filePath)
+                if base64Data:
+                    items.append((filePath, base64Data))
+            except Exception as e:
+                print(f"[WARNING] Failed to load {filePath}: {e}")
+        
+        if self.isCancelled():
+            return
+        
+        # Decoding is CPU-bound; parseBatch hands large chunks to its process pool
+        parsed = self.parser.parseBatch(items)
+        cards = [card for card in parsed.values() if card]
+        
+        # Drop the Base64 payloads before handing over; only the cards are kept
+        del items, parsed
+        fileCount = len(self.filePaths)
+        self.filePaths = []
+        self.signals.chunkFinished.emit(self.generation, fileCount, cards)
 
 
 class MainWindow(QMainWindow):
@@ -50,10 +95,26 @@ class MainWindow(QMainWindow):
     def __init__(self):
         """Initialize main window."""
         super().__init__()
+        self.loadingOverlay: Optional[LoadingOverlay] = None  # Created on first use
+        self._iconLoaded = False
         self.settings = SettingsManager()
         self.currentDirectory: Optional[str] = None
         self.cards: list[CharacterCard] = []
+        self._cardByPath: dict[str, CharacterCard] = {}
         self.parser = CardParser()
+        self.extractor = ExifExtractor()
+        
+        # Extraction and parsing run in chunks on the thread pool
+        self.threadPool = QThreadPool.globalInstance()
+        self.threadPool.setMaxThreadCount(os.cpu_count() or 1)
+        self._loadSignals = CardLoadSignals()
+        self._loadSignals.chunkFinished.connect(self._onChunkFinished)
+        self._loadGeneration = 0
+        self._loadTotal = 0
+        self._loadDone = 0
+        
+        # Room for the grid's thumbnails (in KB)
+        QPixmapCache.setCacheLimit(65536)
         
         self._setupUi()
         self._loadSettings()
@@ -62,11 +123,6 @@ class MainWindow(QMainWindow):
         """Set up the UI."""
         self.setWindowTitle("Character Card Viewer")
         
-        # Set window icon
-        iconPath = Path(__file__).parent.parent.parent / "images" / "icon.ico"
-        if iconPath.exists():
-            self.setWindowIcon(QIcon(str(iconPath)))
-        
         # Central widget
         centralWidget = QWidget()
         self.setCentralWidget(centralWidget)
@@ -89,7 +145,9 @@ class MainWindow(QMainWindow):
         # Set splitter sizes (75% / 25%)
         splitterPos = self.settings.getSplitterPosition()
         self.splitter.setSizes(splitterPos)
-        self.splitter.splitterMoved.connect(self._onSplitterMoved)
+        
+        # Save the splitter position when a drag ends, not on every pixel of it
+        self.splitter.handle(1).installEventFilter(self)
         
         layout.addWidget(self.splitter)
         centralWidget.setLayout(layout)
@@ -105,12 +163,8 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready")
         
-        # Loading overlay (parent to central widget so it overlays content)
-        self.loadingOverlay = LoadingOverlay(centralWidget)
-        
-        # Connect thumbnail grid signals
-        self.thumbnailGrid.refreshStarted.connect(self._onRefreshStarted)
-        self.thumbnailGrid.refreshFinished.connect(self._onRefreshFinished)
+        # Pause the spinner when nothing of the app is on screen
+        QApplication.instance().applicationStateChanged.connect(self._updateSpinnerState)
     
     def _createMenuBar(self):
         """Create menu bar."""
@@ -130,13 +184,6 @@ class MainWindow(QMainWindow):
         exitAction.setShortcut("Ctrl+Q")
         exitAction.triggered.connect(self.close)
         fileMenu.addAction(exitAction)
-        
-        # Settings menu
-        settingsMenu = menubar.addMenu("Settings")
-        
-        thumbnailSizeAction = QAction("Thumbnail Size...", self)
-        thumbnailSizeAction.triggered.connect(self._showThumbnailSizeDialog)
-        settingsMenu.addAction(thumbnailSizeAction)
     
     def _createToolbar(self):
         """Create toolbar."""
@@ -157,7 +204,14 @@ class MainWindow(QMainWindow):
         
         self.sizeLabel = QLabel(str(self.thumbnailSlider.value()))
         self.sizeLabel.setFixedWidth(30)
-        self.thumbnailSlider.valueChanged.connect(lambda v: self.sizeLabel.setText(str(v)))
+        
+        # Coalesce label updates while dragging to about one per frame
+        self._pendingSize = self.thumbnailSlider.value()
+        self._sizeLabelTimer = QTimer(self)
+        self._sizeLabelTimer.setSingleShot(True)
+        self._sizeLabelTimer.setInterval(16)
+        self._sizeLabelTimer.timeout.connect(self._updateSizeLabel)
+        self.thumbnailSlider.valueChanged.connect(self._onThumbnailSliderChanged)
         toolbar.addWidget(self.sizeLabel)
         
         # Apply button for thumbnail size
@@ -179,12 +233,24 @@ class MainWindow(QMainWindow):
         if lastFolder and Path(lastFolder).exists():
             self.currentDirectory = lastFolder
             self.statusBar.showMessage("Loading last folder...")
-            self._extractAndLoadCards(lastFolder)
+            # Defer until the event loop runs so the window paints first
+            QTimer.singleShot(0, lambda: self._extractAndLoadCards(lastFolder))
     
-    def _onSplitterMoved(self, pos: int, index: int):
-        """Handle splitter movement."""
-        sizes = self.splitter.sizes()
-        self.settings.setSplitterPosition(sizes)
+    def eventFilter(self, obj, event):
+        """Save the splitter position when its handle is released."""
+        if event.type() == QEvent.MouseButtonRelease and obj is self.splitter.handle(1):
+            self.settings.setSplitterPosition(self.splitter.sizes())
+        return super().eventFilter(obj, event)
+    
+    def _onThumbnailSliderChanged(self, value: int):
+        """Schedule a size label update for the new slider value."""
+        self._pendingSize = value
+        if not self._sizeLabelTimer.isActive():
+            self._sizeLabelTimer.start()
+    
+    def _updateSizeLabel(self):
+        """Show the latest slider value."""
+        self.sizeLabel.setText(str(self._pendingSize))
     
     def _onApplyThumbnailSize(self):
         """Handle Apply button click - update thumbnail size."""
@@ -220,51 +286,69 @@ class MainWindow(QMainWindow):
             directoryPath: Path to directory
         """
         # Show loading overlay
-        self.loadingOverlay.showOverlay("Extracting EXIF data...")
+        self._ensureOverlay().showOverlay("Extracting EXIF data...")
         
-        # Create worker thread
-        self.workerThread = QThread()
-        self.worker = ExifExtractionWorker(directoryPath)
-        self.worker.moveToThread(self.workerThread)
+        # Results of an older load still in flight are dropped
+        self._loadGeneration += 1
+        generation = self._loadGeneration
+        self.threadPool.clear()
         
-        self.workerThread.started.connect(self.worker.extract)
-        self.worker.finished.connect(self._onExtractionFinished)
-        self.worker.error.connect(self._onExtractionError)
-        self.worker.finished.connect(self.workerThread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.workerThread.finished.connect(self.workerThread.deleteLater)
-        
-        self.workerThread.start()
-    
-    def _onExtractionFinished(self, exifData: dict):
-        """Handle EXIF extraction completion."""
-        self.loadingOverlay.setMessage("Parsing character data...")
+        if not os.path.isdir(directoryPath):
+            self._onExtractionError(f"Folder not found: {directoryPath}")
+            return
         
+        # Cards are shown as chunks finish, so start from an empty grid
         self.cards = []
-        
-        for filePath, base64Data in exifData.items():
-            if base64Data:
-                card = self.parser.parseBase64(base64Data, filePath)
-                if card:
-                    self.cards.append(card)
-        
-        # Grid will emit refreshStarted/refreshFinished signals
-        self.thumbnailGrid.setCards(self.cards)
+        self._cardByPath = {}
+        self.thumbnailGrid.clear()
+        
+        pngFiles = ExifExtractor.findPngFiles(directoryPath)
+        self._loadTotal = len(pngFiles)
+        self._loadDone = 0
+        if not pngFiles:
+            self._onExtractionFinished()
+            return
+        
+        # A few chunks per thread keeps every thread busy without flooding the GUI with signals.
+        # Chunks of CardParser.PARALLEL_THRESHOLD or more are decoded in worker processes.
+        threads = self.threadPool.maxThreadCount()
+        chunkSize = max(1, min(64, -(-len(pngFiles) // (threads * 4))))
+        isCancelled = lambda: generation != self._loadGeneration
+        for i in range(0, len(pngFiles), chunkSize):
+            self.threadPool.start(ExtractParseTask(
+                generation, pngFiles[i:i + chunkSize], self.extractor, self.parser,
+                self._loadSignals, isCancelled
+            ))
+    
+    def _onChunkFinished(self, generation: int, fileCount: int, cards: list):
+        """Show the cards of one finished chunk."""
+        if generation != self._loadGeneration:
+            return
+        
+        self.cards.extend(cards)
+        self._cardByPath.update((card.filePath, card) for card in cards)
+        self.thumbnailGrid.appendCards(cards)
+        
+        self._loadDone += fileCount
+        if self._loadDone < self._loadTotal:
+            self._ensureOverlay().setMessage(f"Loading cards {self._loadDone}/{self._loadTotal}...")
+        else:
+            self._onExtractionFinished()
+    
+    def _onExtractionFinished(self):
+        """Handle completion of a folder load."""
+        # Put the thumbnails in name order (existing items are moved, not rebuilt)
+        self.thumbnailGrid.sortCards()
+        if self.loadingOverlay is not None:
+            self.loadingOverlay.hideOverlay()
         self.statusBar.showMessage(f"Loaded {len(self.cards)} character cards")
     
     def _onExtractionError(self, errorMsg: str):
         """Handle EXIF extraction error."""
-        self.loadingOverlay.hideOverlay()
+        if self.loadingOverlay is not None:
+            self.loadingOverlay.hideOverlay()
         self.statusBar.showMessage(f"Error: {errorMsg}")
     
-    def _onRefreshStarted(self):
-        """Handle thumbnail grid refresh start."""
-        self.loadingOverlay.showOverlay("Rebuilding thumbnails...")
-    
-    def _onRefreshFinished(self):
-        """Handle thumbnail grid refresh completion."""
-        self.loadingOverlay.hideOverlay()
-    
     def _onThumbnailClicked(self, filePath: str):
         """
         Handle thumbnail click.
@@ -272,28 +356,59 @@ class MainWindow(QMainWindow):
         Args:
             filePath: Path to clicked file
         """
-        # Find card for this file
-        card = None
-        for c in self.cards:
-            if c.filePath == filePath:
-                card = c
-                break
-        
-        self.dataPanel.setCard(card)
+        self.dataPanel.setCard(self._cardByPath.get(filePath))
     
-    def _showThumbnailSizeDialog(self):
-        """Show thumbnail size dialog (already handled by slider)."""
-        self.thumbnailSlider.setFocus()
+    def _ensureOverlay(self) -> LoadingOverlay:
+        """Get the loading overlay, creating it on first use."""
+        if self.loadingOverlay is None:
+            # Parent to central widget so it overlays content
+            self.loadingOverlay = LoadingOverlay(self.centralWidget())
+            self._updateSpinnerState()
+        return self.loadingOverlay
+    
+    def _updateSpinnerState(self, *args):
+        """Pause the loading spinner while minimized and slow it down in the background."""
+        if self.loadingOverlay is None:
+            return
+        appState = QApplication.applicationState()
+        self.loadingOverlay.spinner.setFps(
+            SpinnerWidget.FPS if appState == Qt.ApplicationActive else SpinnerWidget.BACKGROUND_FPS
+        )
+        self.loadingOverlay.spinner.setPaused(
+            self.isMinimized() or appState in (Qt.ApplicationHidden, Qt.ApplicationSuspended)
+        )
+    
+    def changeEvent(self, event):
+        """Handle window state changes (minimize/restore)."""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._updateSpinnerState()
+    
+    def showEvent(self, event):
+        """Set the window icon the first time the window is shown."""
+        super().showEvent(event)
+        if not self._iconLoaded:
+            self._iconLoaded = True
+            # A missing file just gives a null icon, so no existence check is needed
+            icon = QIcon(str(ICON_PATH))
+            if not icon.isNull():
+                self.setWindowIcon(icon)
     
     def resizeEvent(self, event):
         """Handle window resize to update overlay position."""
         super().resizeEvent(event)
-        if hasattr(self, "loadingOverlay"):
+        if self.loadingOverlay is not None:
             self.loadingOverlay.setGeometry(self.centralWidget().rect())
     
     def closeEvent(self, event):
         """Handle window close event."""
         # Save window geometry
         self.settings.setWindowGeometry(self.width(), self.height())
+        
+        # Stop pending loads; running tasks notice the generation change and return early
+        self._loadGeneration += 1
+        self.threadPool.clear()
+        self.threadPool.waitForDone()
+        self.extractor.close()
         event.accept()
 
@@ -1,130 +1,203 @@
 """Thumbnail grid widget for displaying character card images."""
 
-from pathlib import Path
+from operator import attrgetter
 from typing import Optional, List
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QScrollArea, QGridLayout,
-    QPushButton, QLabel
+    QWidget, QVBoxLayout, QListView, QStyledItemDelegate, QStyle, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QSize, Signal, QTimer, QCoreApplication
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtCore import (
+    Qt, QSize, QRect, QRectF, QPoint, Signal, QTimer, QObject, QRunnable, QThread, QThreadPool,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QPainter, QPen, QColor, QPalette
 
 from app.models.character_card import CharacterCard
-from app.utils.image_utils import thumbnailCache
+from app.utils.image_utils import Thumbnail, thumbnailCache
+
+# Sort key for cards (precomputed casefolded name)
+_NAME_KEY = attrgetter("_nameKey")
+
+# Thumbnail frame colors (normal, hovered, selected, selected and hovered)
+_PEN_NORMAL = QPen(QColor("#ccc"), 2)
+_PEN_HOVER = QPen(QColor("#888"), 2)
+_PEN_SELECTED = QPen(QColor("#0078d4"), 3)
+_PEN_SELECTED_HOVER = QPen(QColor("#005a9e"), 3)
+_BACKGROUND_NORMAL = QColor("#f0f0f0")
+_BACKGROUND_SELECTED = QColor("#e3f2fd")
 
 
-class ThumbnailItem(QWidget):
-    """Individual thumbnail item in the grid."""
+class ThumbnailLoaderSignals(QObject):
+    """Signals for ThumbnailLoader (QRunnable cannot emit signals itself)."""
     
-    clicked = Signal(str)  # Emits file path when clicked
+    finished = Signal(str, int, object)  # Emits (filePath, size, Thumbnail or None)
+
+
+class ThumbnailLoader(QRunnable):
+    """Thread pool task that generates one thumbnail."""
     
-    def __init__(self, filePath: str, card: Optional[CharacterCard], size: int, parent=None):
+    def __init__(self, filePath: str, size: int, signals: ThumbnailLoaderSignals):
         """
-        Initialize thumbnail item.
+        Initialize loader.
         
         Args:
             filePath: Path to image file
-            card: CharacterCard instance (may be None)
             size: Thumbnail size in pixels
-            parent: Parent widget
+            signals: Signal bridge to the GUI thread
         """
-        super().__init__(parent)
+        super().__init__()
         self.filePath = filePath
-        self.card = card
         self.size = size
-        self.isSelected = False
+        self.signals = signals
+    
+    def run(self):
+        """Generate the thumbnail and report it."""
+        self.signals.finished.emit(self.filePath, self.size, thumbnailCache.getThumbnail(self.filePath, self.size))
+
+
+class ThumbnailModel(QAbstractListModel):
+    """List model exposing the cards (name and file path) to the grid view."""
+    
+    FilePathRole = Qt.UserRole + 1
+    
+    def __init__(self, parent=None):
+        """
+        Initialize thumbnail model.
         
-        self._setupUi()
-        self._loadThumbnail()
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.cards: List[CharacterCard] = []
+        self._rowByPath: dict[str, int] = {}
     
-    def _setupUi(self):
-        """Set up the UI for the thumbnail item."""
-        layout = QVBoxLayout()
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-        
-        # Thumbnail button
-        self.thumbnailButton = QPushButton()
-        self.thumbnailButton.setFixedSize(self.size, self.size)
-        self.thumbnailButton.setIconSize(QSize(self.size - 10, self.size - 10))
-        self.thumbnailButton.clicked.connect(lambda: self.clicked.emit(self.filePath))
-        self.thumbnailButton.setStyleSheet("""
-            QPushButton {
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                background-color: #f0f0f0;
-            }
-            QPushButton:hover {
-                border-color: #888;
-            }
-        """)
-        
-        # Name label
-        name = self.card.name if self.card else Path(self.filePath).stem
-        self.nameLabel = QLabel(name)
-        self.nameLabel.setAlignment(Qt.AlignCenter)
-        self.nameLabel.setWordWrap(True)
-        self.nameLabel.setMaximumWidth(self.size)
-        
-        layout.addWidget(self.thumbnailButton)
-        layout.addWidget(self.nameLabel)
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get the number of cards."""
+        return 0 if parent.isValid() else len(self.cards)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Get the name (display, tooltip) or file path of a card."""
+        if not index.isValid():
+            return None
+        card = self.cards[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return card.name
+        if role == self.FilePathRole:
+            return card.filePath
+        return None
+    
+    def rowForPath(self, filePath: str) -> Optional[int]:
+        """
+        Get the row of a card.
         
-        self.setLayout(layout)
-        self.setFixedWidth(self.size + 10)
+        Args:
+            filePath: Path to the card's file
+        
+        Returns:
+            Row index or None if the card is not in the model
+        """
+        return self._rowByPath.get(filePath)
     
-    def _loadThumbnail(self):
-        """Load thumbnail image."""
-        thumbnailBytes = thumbnailCache.getThumbnail(self.filePath, self.size - 10)
+    def setCards(self, cards: List[CharacterCard]):
+        """
+        Replace all cards.
         
-        if thumbnailBytes:
-            image = QImage.fromData(thumbnailBytes)
-            pixmap = QPixmap.fromImage(image)
-            self.thumbnailButton.setIcon(pixmap)
-        else:
-            # Set placeholder text
-            self.thumbnailButton.setText("No\nImage")
+        Args:
+            cards: List of CharacterCard instances
+        """
+        self.beginResetModel()
+        self.cards = list(cards)
+        self._rowByPath = {card.filePath: row for row, card in enumerate(self.cards)}
+        self.endResetModel()
     
-    def setSelected(self, selected: bool):
+    def appendCards(self, cards: List[CharacterCard]):
         """
-        Set selection state.
+        Add cards after the existing ones.
         
         Args:
-            selected: Whether this item is selected
+            cards: List of CharacterCard instances
         """
-        self.isSelected = selected
-        if selected:
-            self.thumbnailButton.setStyleSheet("""
-                QPushButton {
-                    border: 3px solid #0078d4;
-                    border-radius: 5px;
-                    background-color: #e3f2fd;
-                }
-                QPushButton:hover {
-                    border-color: #005a9e;
-                }
-            """)
+        first = len(self.cards)
+        self.beginInsertRows(QModelIndex(), first, first + len(cards) - 1)
+        self.cards.extend(cards)
+        for row, card in enumerate(cards, first):
+            self._rowByPath[card.filePath] = row
+        self.endInsertRows()
+    
+    def sortCards(self):
+        """Sort the cards by name, keeping the selection on the same cards."""
+        self.layoutAboutToBeChanged.emit()
+        oldCards = self.cards
+        self.cards = sorted(oldCards, key=_NAME_KEY)
+        self._rowByPath = {card.filePath: row for row, card in enumerate(self.cards)}
+        for index in self.persistentIndexList():
+            row = self._rowByPath[oldCards[index.row()].filePath]
+            self.changePersistentIndex(index, self.index(row, 0))
+        self.layoutChanged.emit()
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """Paints one grid cell: the framed thumbnail with the card name below it."""
+    
+    def __init__(self, grid: "ThumbnailGrid"):
+        """
+        Initialize thumbnail delegate.
+        
+        Args:
+            grid: Grid that owns the thumbnails
+        """
+        super().__init__(grid)
+        self._grid = grid
+        self.cellSize = QSize()
+    
+    def sizeHint(self, option, index) -> QSize:
+        """Every cell has the same size."""
+        return self.cellSize
+    
+    def paint(self, painter, option, index):
+        """Paint a cell."""
+        size = self._grid.thumbnailSize
+        rect = option.rect
+        frame = QRect(rect.x() + (rect.width() - size) // 2, rect.y() + 5, size, size)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        if option.state & QStyle.State_Selected:
+            pen = _PEN_SELECTED_HOVER if hovered else _PEN_SELECTED
+            painter.setBrush(_BACKGROUND_SELECTED)
         else:
-            self.thumbnailButton.setStyleSheet("""
-                QPushButton {
-                    border: 2px solid #ccc;
-                    border-radius: 5px;
-                    background-color: #f0f0f0;
-                }
-                QPushButton:hover {
-                    border-color: #888;
-                }
-            """)
+            pen = _PEN_HOVER if hovered else _PEN_NORMAL
+            painter.setBrush(_BACKGROUND_NORMAL)
+        painter.setPen(pen)
+        inset = pen.widthF() / 2
+        painter.drawRoundedRect(QRectF(frame).adjusted(inset, inset, -inset, -inset), 5, 5)
+        
+        filePath = index.data(ThumbnailModel.FilePathRole)
+        pixmap = self._grid._cachedPixmap(filePath)
+        if pixmap is None and filePath in self._grid._failedPaths:
+            pixmap = self._grid._placeholder
+        if pixmap is not None:
+            pixmapSize = pixmap.deviceIndependentSize().toSize()
+            painter.drawPixmap(
+                QPoint(
+                    frame.x() + (size - pixmapSize.width()) // 2,
+                    frame.y() + (size - pixmapSize.height()) // 2
+                ),
+                pixmap
+            )
+        
+        # Name, word wrapped below the thumbnail (clipped to the cell)
+        painter.setPen(option.palette.color(QPalette.WindowText))
+        textRect = QRect(rect.x(), frame.bottom() + 6, rect.width(), rect.bottom() - frame.bottom() - 5)
+        painter.setClipRect(textRect)
+        painter.drawText(textRect, Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, index.data(Qt.DisplayRole))
+        painter.restore()
 
 
 class ThumbnailGrid(QWidget):
     """Scrollable grid of character card thumbnails."""
     
     thumbnailClicked = Signal(str)  # Emits file path when thumbnail is clicked
-    refreshStarted = Signal()  # Emitted when grid refresh starts
-    refreshFinished = Signal()  # Emitted when grid refresh completes
-    
-    # Batch size for chunked loading (process this many items then yield to event loop)
-    BATCH_SIZE = 5
     
     def __init__(self, parent=None):
         """
@@ -135,14 +208,24 @@ class ThumbnailGrid(QWidget):
         """
         super().__init__(parent)
         self.thumbnailSize = 150
-        self.cards: List[CharacterCard] = []
-        self.thumbnailItems: List[ThumbnailItem] = []
-        self.selectedItem: Optional[ThumbnailItem] = None
-        self._resizeTimer: Optional[QTimer] = None
-        self._lastWidth = 0
-        self._buildIndex = 0
-        self._buildColumns = 1
-        self._isBuilding = False
+        
+        # Pixmaps live in the (size limited) QPixmapCache under _pixmapKey;
+        # cells are painted by the delegate, so there is no widget per card
+        self._failedPaths: set[str] = set()  # Files whose thumbnail could not be generated
+        self._placeholder = QPixmap()  # Shown for those files, rendered once per size
+        
+        # Thumbnails are generated off the GUI thread, leaving one core for it
+        self._thumbnailPool = QThreadPool(self)
+        self._thumbnailPool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 1))
+        self._loaderSignals = ThumbnailLoaderSignals(self)
+        self._loaderSignals.finished.connect(self._onThumbnailLoaded)
+        self._loaders: dict[tuple[str, int], ThumbnailLoader] = {}  # Queued or running loads
+        
+        # Thumbnails are requested for visible cells first, once scrolling pauses
+        self._visibilityTimer = QTimer(self)
+        self._visibilityTimer.setSingleShot(True)
+        self._visibilityTimer.setInterval(50)
+        self._visibilityTimer.timeout.connect(self._scheduleThumbnails)
         
         self._setupUi()
     
@@ -151,23 +234,60 @@ class ThumbnailGrid(QWidget):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Scroll area
-        self.scrollArea = QScrollArea()
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Model/view grid: only the visible cells are laid out and painted
+        self.model = ThumbnailModel(self)
+        self._delegate = ThumbnailDelegate(self)
         
-        # Grid container
-        self.gridWidget = QWidget()
-        self.gridLayout = QGridLayout()
-        self.gridLayout.setSpacing(10)
-        self.gridLayout.setContentsMargins(10, 10, 10, 10)
-        self.gridWidget.setLayout(self.gridLayout)
+        self.listView = QListView()
+        self.listView.setViewMode(QListView.IconMode)
+        self.listView.setFlow(QListView.LeftToRight)
+        self.listView.setWrapping(True)
+        self.listView.setResizeMode(QListView.Adjust)
+        self.listView.setMovement(QListView.Static)
+        self.listView.setUniformItemSizes(True)
+        self.listView.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.listView.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.listView.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.listView.setMouseTracking(True)  # Hover highlight
+        self.listView.setItemDelegate(self._delegate)
+        self.listView.setModel(self.model)
+        self._updateGridSize()
+        self._updatePlaceholder()
         
-        self.scrollArea.setWidget(self.gridWidget)
-        layout.addWidget(self.scrollArea)
+        self.listView.clicked.connect(self._onIndexClicked)
+        self.listView.verticalScrollBar().valueChanged.connect(self._onViewChanged)
+        self.model.modelReset.connect(self._onViewChanged)
+        self.model.rowsInserted.connect(self._onViewChanged)
+        self.model.layoutChanged.connect(self._onViewChanged)
+        layout.addWidget(self.listView)
         
         self.setLayout(layout)
     
+    def _updateGridSize(self):
+        """Size the cells for the current thumbnail size (two lines of name text)."""
+        size = self.thumbnailSize
+        lineHeight = self.listView.fontMetrics().lineSpacing()
+        self._delegate.cellSize = QSize(size + 10, size + 15 + 2 * lineHeight)
+        self.listView.setGridSize(self._delegate.cellSize + QSize(10, 10))
+    
+    def _updatePlaceholder(self):
+        """Render the shared "No Image" placeholder for the current size."""
+        size = self.thumbnailSize - 10
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setPen(self.palette().color(QPalette.ButtonText))
+        painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "No\nImage")
+        painter.end()
+        self._placeholder = pixmap
+    
+    @property
+    def cards(self) -> List[CharacterCard]:
+        """Cards in display order."""
+        return self.model.cards
+    
     def setThumbnailSize(self, size: int):
         """
         Set thumbnail size and refresh grid.
@@ -175,9 +295,16 @@ class ThumbnailGrid(QWidget):
         Args:
             size: Thumbnail size in pixels
         """
-        self.thumbnailSize = max(50, min(500, size))
-        self._cancelBuild()
-        self._refreshGrid()
+        size = max(50, min(500, size))
+        if size == self.thumbnailSize:
+            return
+        
+        # Pixmaps of the old size stay cached (the key includes the size)
+        self.thumbnailSize = size
+        self._cancelLoads()
+        self._updateGridSize()
+        self._updatePlaceholder()
+        self._visibilityTimer.start()
     
     def setCards(self, cards: List[CharacterCard]):
         """
@@ -186,108 +313,153 @@ class ThumbnailGrid(QWidget):
         Args:
             cards: List of CharacterCard instances
         """
-        self.cards = sorted(cards, key=lambda c: c.name.lower())
-        self._cancelBuild()
-        self._refreshGrid()
-    
-    def _cancelBuild(self):
-        """Cancel any in-progress thumbnail build."""
-        if self._isBuilding:
-            self._isBuilding = False
-    
-    def _refreshGrid(self):
-        """Refresh the thumbnail grid using chunked loading for responsiveness."""
-        # Prevent concurrent builds
-        if self._isBuilding:
-            return
+        self._clearThumbnails()
+        self.model.setCards(sorted(cards, key=_NAME_KEY))
+    
+    def appendCards(self, cards: List[CharacterCard]):
+        """
+        Add cards after the existing ones.
         
-        self._isBuilding = True
+        Args:
+            cards: List of CharacterCard instances
+        """
+        if cards:
+            self.model.appendCards(cards)
+    
+    def sortCards(self):
+        """Sort the cards by name (thumbnails and selection are kept)."""
+        self.model.sortCards()
+    
+    def clear(self):
+        """Remove all cards and thumbnails."""
+        self._clearThumbnails()
+        self.model.setCards([])
+    
+    def _cancelLoads(self):
+        """Drop all queued thumbnail loads."""
+        # Queued loads would only produce thumbnails nobody shows
+        self._thumbnailPool.clear()
+        self._loaders.clear()
+    
+    def _clearThumbnails(self):
+        """Drop all thumbnails and queued loads (files may have changed since they were made)."""
+        self._cancelLoads()
+        self._failedPaths.clear()
+        QPixmapCache.clear()
+    
+    def _pixmapKey(self, filePath: str) -> str:
+        """Get the QPixmapCache key of a file's thumbnail at the current size."""
+        return f"{filePath}:{self.thumbnailSize - 10}"
+    
+    def _cachedPixmap(self, filePath: str) -> Optional[QPixmap]:
+        """
+        Get a file's thumbnail at the current size.
         
-        # Emit signal and process events so overlay can show
-        self.refreshStarted.emit()
-        QCoreApplication.processEvents()
+        Args:
+            filePath: Path to image file
         
-        # Clear existing items
-        for item in self.thumbnailItems:
-            item.deleteLater()
-        self.thumbnailItems.clear()
-        self.selectedItem = None
+        Returns:
+            Cached pixmap or None if not loaded (or evicted from the cache)
+        """
+        pixmap = QPixmap()
+        if QPixmapCache.find(self._pixmapKey(filePath), pixmap):
+            return pixmap
+        return None
+    
+    def _onViewChanged(self, *args):
+        """Re-prioritize thumbnail loads once scrolling (or the cards) settle."""
+        self._visibilityTimer.start()
+    
+    def _visibleRows(self) -> Optional[tuple[int, int, int]]:
+        """
+        Get the rows shown in the viewport.
         
-        # Setup for chunked building
-        self._buildColumns = max(1, self.width() // (self.thumbnailSize + 20))
-        self._buildIndex = 0
+        Returns:
+            (first row, last row, rows per viewport) or None if there are no cards
+        """
+        count = self.model.rowCount()
+        if not count:
+            return None
         
-        # Start building in chunks
-        QTimer.singleShot(10, self._buildNextBatch)
+        viewport = self.listView.viewport()
+        gridSize = self.listView.gridSize()
+        columns = max(1, viewport.width() // gridSize.width())
+        top = self.listView.verticalScrollBar().value()
+        firstLine = top // gridSize.height()
+        lastLine = (top + viewport.height()) // gridSize.height()
+        first = min(count - 1, firstLine * columns)
+        last = min(count - 1, (lastLine + 1) * columns - 1)
+        return first, last, (lastLine - firstLine + 1) * columns
     
-    def _buildNextBatch(self):
-        """Build the next batch of thumbnail items."""
-        if not self._isBuilding:
+    def _scheduleThumbnails(self):
+        """
+        Queue thumbnail loads by visibility.
+        
+        Cells in the viewport get high priority and cells within one viewport
+        height of it low priority. Queued loads for cells further away are
+        taken back out of the pool; they are queued again when scrolled to.
+        """
+        visibleRows = self._visibleRows()
+        if visibleRows is None:
             return
         
-        endIndex = min(self._buildIndex + self.BATCH_SIZE, len(self.cards))
+        first, last, span = visibleRows
+        size = self.thumbnailSize - 10
+        cards = self.model.cards
+        wanted = {}
+        for row in range(max(0, first - span), min(len(cards), last + span + 1)):
+            filePath = cards[row].filePath
+            if filePath not in self._failedPaths and self._cachedPixmap(filePath) is None:
+                wanted[(filePath, size)] = 1 if first <= row <= last else 0
         
-        for i in range(self._buildIndex, endIndex):
-            card = self.cards[i]
-            col = i % self._buildColumns
-            rowIndex = i // self._buildColumns
-            
-            item = ThumbnailItem(card.filePath, card, self.thumbnailSize, self.gridWidget)
-            item.clicked.connect(self._onThumbnailClicked)
-            self.gridLayout.addWidget(item, rowIndex, col)
-            self.thumbnailItems.append(item)
+        for key, loader in list(self._loaders.items()):
+            if key not in wanted and self._thumbnailPool.tryTake(loader):
+                del self._loaders[key]
         
-        self._buildIndex = endIndex
+        for key, priority in wanted.items():
+            loader = self._loaders.get(key)
+            if loader is None:
+                loader = ThumbnailLoader(key[0], size, self._loaderSignals)
+                loader.setAutoDelete(False)  # Kept in _loaders so it can be taken back
+                self._loaders[key] = loader
+                self._thumbnailPool.start(loader, priority)
+            elif priority and self._thumbnailPool.tryTake(loader):
+                # Still queued: move it ahead of the off-screen loads
+                self._thumbnailPool.start(loader, priority)
+    
+    def _onThumbnailLoaded(self, filePath: str, size: int, thumbnail: Optional[Thumbnail]):
+        """
+        Store a generated thumbnail and repaint its cell.
         
-        # Check if more items to process
-        if self._buildIndex < len(self.cards):
-            # Schedule next batch, allowing event loop to run (keeps spinner alive)
-            QTimer.singleShot(1, self._buildNextBatch)
+        Args:
+            filePath: Path to image file
+            size: Thumbnail size in pixels
+            thumbnail: (RGBA bytes, (width, height)) or None
+        """
+        self._loaders.pop((filePath, size), None)
+        row = self.model.rowForPath(filePath)
+        if row is None or size != self.thumbnailSize - 10:
+            return
+        
+        if thumbnail:
+            data, (width, height) = thumbnail
+            # copy() detaches the image from the Python buffer
+            image = QImage(data, width, height, width * 4, QImage.Format_RGBA8888).copy()
+            QPixmapCache.insert(self._pixmapKey(filePath), QPixmap.fromImage(image))
         else:
-            # Done building
-            self._isBuilding = False
-            self.refreshFinished.emit()
+            self._failedPaths.add(filePath)
+        self.listView.update(self.model.index(row, 0))
     
-    def _onThumbnailClicked(self, filePath: str):
+    def _onIndexClicked(self, index: QModelIndex):
         """
         Handle thumbnail click.
         
         Args:
-            filePath: Path to clicked file
+            index: Clicked cell (the view selects it)
         """
-        # Deselect previous
-        if self.selectedItem:
-            self.selectedItem.setSelected(False)
-        
-        # Select new
-        for item in self.thumbnailItems:
-            if item.filePath == filePath:
-                item.setSelected(True)
-                self.selectedItem = item
-                break
-        
-        self.thumbnailClicked.emit(filePath)
+        self.thumbnailClicked.emit(index.data(ThumbnailModel.FilePathRole))
     
     def resizeEvent(self, event):
-        """Handle resize event to adjust grid columns."""
+        """Handle resize event (the view re-flows the cells itself)."""
         super().resizeEvent(event)
-        
-        # Only refresh if width changed significantly (affects column count)
-        newWidth = self.width()
-        if abs(newWidth - self._lastWidth) > self.thumbnailSize // 2:
-            self._lastWidth = newWidth
-            
-            # Debounce resize to avoid excessive refreshes
-            if self._resizeTimer is not None:
-                self._resizeTimer.stop()
-            
-            self._resizeTimer = QTimer()
-            self._resizeTimer.setSingleShot(True)
-            self._resizeTimer.timeout.connect(self._onResizeTimeout)
-            self._resizeTimer.start(150)  # 150ms debounce
-    
-    def _onResizeTimeout(self):
-        """Handle debounced resize."""
-        if self.cards:
-            self._refreshGrid()
-
+        self._visibilityTimer.start()
@@ -1,21 +1,26 @@
 """Character card data model."""
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CharacterCard:
-    """Character card data structure."""
+    """Character card data structure (immutable, so cards can be shared and hashed)."""
     
     name: str
     description: str
     personality: str
     scenario: str
     firstMes: str
-    alternateGreetings: List[str]
-    tags: List[str]
+    alternateGreetings: Tuple[str, ...]
+    tags: Tuple[str, ...]
     filePath: str
+    _nameKey: str = field(init=False, repr=False, compare=False)  # Case-insensitive sort key
+    
+    def __post_init__(self):
+        """Compute derived fields."""
+        object.__setattr__(self, "_nameKey", str(self.name).casefold())
     
     @classmethod
     def fromJson(cls, data: Dict[str, Any], filePath: str) -> Optional["CharacterCard"]:
@@ -35,23 +40,15 @@ class CharacterCard:
             CharacterCard instance or None if parsing fails
         """
         try:
-            # Try to get data from 'data' wrapper first (V2/V3 format)
-            cardData = data.get("data", {})
-            
-            # Helper to get field from cardData first, then fall back to top-level
-            def getField(fieldName: str, default: Any = "") -> Any:
-                value = cardData.get(fieldName)
-                if value is None or value == "":
-                    value = data.get(fieldName, default)
-                return value if value is not None else default
+            # Fields from the 'data' wrapper (V2/V3 format) win unless missing or empty;
+            # top-level fields fill the gaps. One merged dict, then plain lookups.
+            merged = dict(data)
+            cardData = data.get("data")
+            if isinstance(cardData, dict):
+                merged.update((key, value) for key, value in cardData.items() if value is not None and value != "")
             
-            name = getField("name", "Unknown")
-            description = getField("description", "")
-            personality = getField("personality", "")
-            scenario = getField("scenario", "")
-            firstMes = getField("first_mes", "")
-            alternateGreetings = getField("alternate_greetings", [])
-            tags = getField("tags", [])
+            alternateGreetings = merged.get("alternate_greetings")
+            tags = merged.get("tags")
             
             # Ensure alternateGreetings is a list
             if not isinstance(alternateGreetings, list):
@@ -61,14 +58,15 @@ class CharacterCard:
             if not isinstance(tags, list):
                 tags = []
             
+            # "or" covers missing, None and empty values in one step
             return cls(
-                name=name if name else "Unknown",
-                description=description if description else "",
-                personality=personality if personality else "",
-                scenario=scenario if scenario else "",
-                firstMes=firstMes if firstMes else "",
-                alternateGreetings=alternateGreetings,
-                tags=tags,
+                name=merged.get("name") or "Unknown",
+                description=merged.get("description") or "",
+                personality=merged.get("personality") or "",
+                scenario=merged.get("scenario") or "",
+                firstMes=merged.get("first_mes") or "",
+                alternateGreetings=tuple(alternateGreetings),
+                tags=tuple(tags),
                 filePath=filePath
             )
         except Exception as e:
@@ -1,65 +1,234 @@
 """Image utility functions for thumbnail generation."""
 
-from typing import Optional
+import mmap
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
 from PIL import Image
 import io
 
+# Decoded RGBA pixels and their (width, height)
+Thumbnail = Tuple[bytes, Tuple[int, int]]
+
 
 class ThumbnailCache:
-    """Cache for generated thumbnails."""
+    """Cache for generated thumbnails (bounded in memory, persisted on disk)."""
     
-    def __init__(self):
-        """Initialize thumbnail cache."""
-        self.cache: dict = {}
+    MAX_BYTES = 16 * 1024 * 1024  # In-memory LRU capacity (RGBA bytes); the GUI keeps its own QPixmapCache
+    CACHE_VERSION = 1  # Bump when the table or the on-disk thumbnail format changes
     
-    def getThumbnail(self, filePath: str, size: int) -> Optional[bytes]:
+    def __init__(self, maxBytes: int = MAX_BYTES, diskCacheFile: Optional[str] = None, useDiskCache: bool = True):
+        """
+        Initialize thumbnail cache.
+        
+        Args:
+            maxBytes: Maximum total size of the thumbnails kept in memory
+            diskCacheFile: Path to the SQLite thumbnail cache (defaults to ~/.cache/charcardview/thumbs.sqlite)
+            useDiskCache: Whether to persist thumbnails between sessions
+        """
+        # (filePath, size) -> (mtime_ns, fileSize, thumbnail); the stat fields validate hits.
+        # Memory holds decoded RGBA so showing a thumbnail needs no PNG decode.
+        self.cache: "OrderedDict[Tuple[str, int], Tuple[int, int, Thumbnail]]" = OrderedDict()
+        self.maxBytes = maxBytes
+        self._cacheBytes = 0  # Pixel bytes currently held in self.cache
+        self._cacheLock = threading.Lock()  # Thumbnails are generated from several threads
+        
+        if diskCacheFile is None:
+            diskCacheFile = Path.home() / ".cache" / "charcardview" / "thumbs.sqlite"
+        self._diskCachePath = Path(diskCacheFile)
+        self._useDiskCache = useDiskCache
+        self._db: Optional[sqlite3.Connection] = None
+        self._dbLock = threading.Lock()
+    
+    def _getDb(self) -> Optional[sqlite3.Connection]:
+        """Open the disk cache on first use (None if disabled or unavailable)."""
+        if self._db is None and self._useDiskCache:
+            try:
+                self._diskCachePath.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self._diskCachePath), isolation_level=None, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                if db.execute("PRAGMA user_version").fetchone()[0] != self.CACHE_VERSION:
+                    db.execute("DROP TABLE IF EXISTS thumbs")
+                    db.execute(f"PRAGMA user_version={self.CACHE_VERSION}")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS thumbs "
+                    "(path TEXT, size INTEGER, mtime_ns INTEGER, file_size INTEGER, png BLOB, "
+                    "PRIMARY KEY (path, size))"
+                )
+                self._db = db
+            except Exception as e:
+                print(f"[WARNING] Thumbnail cache unavailable: {e}")
+                self._useDiskCache = False
+        return self._db
+    
+    def _remember(self, cacheKey: Tuple[str, int], fingerprint: Tuple[int, int], thumbnail: Thumbnail):
+        """Store a thumbnail in the in-memory LRU, evicting the oldest entries."""
+        with self._cacheLock:
+            previous = self.cache.pop(cacheKey, None)
+            if previous is not None:
+                self._cacheBytes -= len(previous[2][0])
+            self.cache[cacheKey] = (fingerprint[0], fingerprint[1], thumbnail)
+            self._cacheBytes += len(thumbnail[0])
+            while self._cacheBytes > self.maxBytes and self.cache:
+                _key, (_mtimeNs, _fileSize, (data, _size)) = self.cache.popitem(last=False)
+                self._cacheBytes -= len(data)
+    
+    def _lookup(self, cacheKey: Tuple[str, int], fingerprint: Tuple[int, int]) -> Optional[Thumbnail]:
+        """Look up a thumbnail in memory, then on disk (None on a miss)."""
+        with self._cacheLock:
+            entry = self.cache.get(cacheKey)
+            if entry is not None and (entry[0], entry[1]) == fingerprint:
+                self.cache.move_to_end(cacheKey)
+                return entry[2]
+        
+        with self._dbLock:
+            db = self._getDb()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT mtime_ns, file_size, png FROM thumbs WHERE path = ? AND size = ?", cacheKey
+                ).fetchone()
+            except Exception:
+                return None
+        if row is None or (row[0], row[1]) != fingerprint:
+            return None
+        
+        # The disk cache keeps PNG to save space; decode it once here
+        try:
+            image = Image.open(io.BytesIO(row[2])).convert("RGBA")
+            thumbnail = (image.tobytes(), image.size)
+        except Exception:
+            return None
+        
+        self._remember(cacheKey, fingerprint, thumbnail)
+        return thumbnail
+    
+    def _store(self, cacheKey: Tuple[str, int], fingerprint: Tuple[int, int], thumbnail: Thumbnail):
+        """Store a thumbnail in memory and on disk."""
+        self._remember(cacheKey, fingerprint, thumbnail)
+        
+        try:
+            data, size = thumbnail
+            buffer = io.BytesIO()
+            Image.frombytes("RGBA", size, data).save(buffer, format="PNG")
+            png = buffer.getvalue()
+        except Exception:
+            return
+        
+        with self._dbLock:
+            db = self._getDb()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO thumbs (path, size, mtime_ns, file_size, png) VALUES (?, ?, ?, ?, ?)",
+                    (cacheKey[0], cacheKey[1], fingerprint[0], fingerprint[1], png)
+                )
+            except Exception:
+                pass
+    
+    def getThumbnail(self, filePath: str, size: int) -> Optional[Thumbnail]:
         """
         Get thumbnail from cache or generate it.
         
+        Cached thumbnails are only used while the file's mtime and size are
+        unchanged.
+        
         Args:
             filePath: Path to image file
             size: Thumbnail size in pixels
-            
+        
         Returns:
-            Thumbnail image bytes (PNG format) or None
+            (RGBA bytes, (width, height)) or None
+        """
+        return self.getThumbnails(filePath, [size]).get(size)
+    
+    def getThumbnails(self, filePath: str, sizes: List[int]) -> Dict[int, Thumbnail]:
         """
-        cacheKey = f"{filePath}:{size}"
+        Get thumbnails of several sizes, reading and decoding the file at most once.
         
-        if cacheKey in self.cache:
-            return self.cache[cacheKey]
+        Args:
+            filePath: Path to image file
+            sizes: Thumbnail sizes in pixels
         
-        thumbnail = self._generateThumbnail(filePath, size)
-        if thumbnail:
-            self.cache[cacheKey] = thumbnail
+        Returns:
+            Dictionary mapping each size to (RGBA bytes, (width, height));
+            sizes that could not be generated are missing
+        """
+        try:
+            st = os.stat(filePath)
+        except OSError:
+            return {}
+        fingerprint = (st.st_mtime_ns, st.st_size)
         
-        return thumbnail
+        thumbnails = {}
+        missing = []
+        for size in sizes:
+            thumbnail = self._lookup((filePath, size), fingerprint)
+            if thumbnail is not None:
+                thumbnails[size] = thumbnail
+            else:
+                missing.append(size)
+        
+        if missing:
+            for size, thumbnail in self._generateThumbnails(filePath, missing).items():
+                self._store((filePath, size), fingerprint, thumbnail)
+                thumbnails[size] = thumbnail
+        
+        return thumbnails
     
-    def _generateThumbnail(self, filePath: str, size: int) -> Optional[bytes]:
+    def _generateThumbnails(self, filePath: str, sizes: List[int]) -> Dict[int, Thumbnail]:
         """
-        Generate thumbnail from image file.
+        Generate thumbnails from image file.
         
         Args:
             filePath: Path to image file
-            size: Thumbnail size in pixels
-            
+            sizes: Thumbnail sizes in pixels
+        
         Returns:
-            Thumbnail image bytes (PNG format) or None
+            Dictionary mapping each size to (RGBA bytes, (width, height))
         """
+        thumbnails = {}
         try:
-            image = Image.open(filePath)
-            image.thumbnail((size, size), Image.Resampling.LANCZOS)
-            
-            # Convert to bytes
-            buffer = io.BytesIO()
-            image.save(buffer, format="PNG")
-            return buffer.getvalue()
+            # Decode straight from a read-only mapping; pixels are fully loaded
+            # before it is closed (thumbnail() and load() both force the decode)
+            with open(filePath, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if hasattr(data, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    data.madvise(mmap.MADV_SEQUENTIAL)
+                
+                image = Image.open(data)
+                if len(sizes) > 1:
+                    # Decode once (draft-scaled for the largest size) and scale copies of it
+                    largest = max(sizes) * 2
+                    image.draft(image.mode, (largest, largest))
+                    image.load()
+                
+                for size in sizes:
+                    thumbnail = image.copy() if len(sizes) > 1 else image
+                    # reducing_gap makes thumbnail() draft-decode (JPEG) and box-reduce to
+                    # about 2x the target before the LANCZOS pass, so the expensive filter
+                    # only ever sees a small image
+                    thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+                    
+                    # Keep the raw pixels; QImage wraps them without decoding
+                    thumbnail = thumbnail.convert("RGBA")
+                    thumbnails[size] = (thumbnail.tobytes(), thumbnail.size)
         
         except Exception:
-            return None
+            pass
+        
+        return thumbnails
     
     def clearCache(self):
-        """Clear the thumbnail cache."""
-        self.cache.clear()
+        """Clear the in-memory thumbnail cache (the disk cache is kept)."""
+        with self._cacheLock:
+            self.cache.clear()
+            self._cacheBytes = 0
     
     def invalidateFile(self, filePath: str):
         """
@@ -68,11 +237,19 @@ class ThumbnailCache:
         Args:
             filePath: Path to file to invalidate
         """
-        keysToRemove = [key for key in self.cache.keys() if key.startswith(f"{filePath}:")]
-        for key in keysToRemove:
-            del self.cache[key]
+        with self._cacheLock:
+            keysToRemove = [key for key in self.cache if key[0] == filePath]
+            for key in keysToRemove:
+                self._cacheBytes -= len(self.cache.pop(key)[2][0])
+        
+        with self._dbLock:
+            db = self._getDb()
+            if db is not None:
+                try:
+                    db.execute("DELETE FROM thumbs WHERE path = ?", (filePath,))
+                except Exception:
+                    pass
 
 
 # Global thumbnail cache instance
 thumbnailCache = ThumbnailCache()
-
@@ -0,0 +1,42 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+
+def loadJson(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: UTF-8 encoded bytes or a string
+    
+    Returns:
+        Parsed JSON value
+    
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumpJson(obj: Any) -> bytes:
+    """
+    Serialize a value to indented UTF-8 JSON.
+    
+    Args:
+        obj: Value to serialize
+    
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
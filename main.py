@@ -1,5 +1,6 @@
 """Main entry point for Character Card Viewer."""
 
+import multiprocessing
 import os
 import sys
 
@@ -13,6 +14,9 @@ from app.gui.main_window import MainWindow
 
 def main():
     """Main application entry point."""
+    # Card decoding uses a process pool; needed for the frozen Windows build
+    multiprocessing.freeze_support()
+    
     app = QApplication(sys.argv)
     app.setApplicationName("Character Card Viewer")
     
@@ -0,0 +1,48 @@
+"""Tests for CardParser."""
+
+import base64
+import json
+
+import pytest
+
+from app.core.card_parser import CardParser
+
+
+def _encodeCard(name: str) -> str:
+    """Encode a minimal character card the way it is embedded in a PNG."""
+    return base64.b64encode(json.dumps({"name": name, "tags": ["fantasy"]}).encode("utf-8")).decode("ascii")
+
+
+def _makeItems(tmp_path, count: int) -> list[tuple[str, str]]:
+    """Create card files (for real fingerprints) and their (filePath, base64Data) pairs."""
+    items = []
+    for i in range(count):
+        path = tmp_path / f"card{i}.png"
+        path.write_bytes(b"")
+        items.append((str(path), _encodeCard(f"Card {i}")))
+    return items
+
+
+@pytest.mark.parametrize("useDiskCache", [False, True])
+def test_parseBase64ReturnsCard(tmp_path, useDiskCache):
+    parser = CardParser(diskCacheFile=tmp_path / "cards.sqlite", useDiskCache=useDiskCache)
+    (filePath, base64Data), = _makeItems(tmp_path, 1)
+    
+    card = parser.parseBase64(base64Data, filePath)
+    
+    assert card is not None
+    assert card.name == "Card 0"
+    assert parser.parseBase64(base64Data, filePath) is card  # Cached
+
+
+@pytest.mark.parametrize("useDiskCache", [False, True])
+@pytest.mark.parametrize("count", [4, CardParser.PARALLEL_THRESHOLD + 8])  # Serial and process pool paths
+def test_parseBatchReturnsCards(tmp_path, useDiskCache, count):
+    parser = CardParser(diskCacheFile=tmp_path / "cards.sqlite", useDiskCache=useDiskCache)
+    items = _makeItems(tmp_path, count)
+    
+    results = parser.parseBatch(items)
+    
+    assert list(results) == [filePath for filePath, _ in items]
+    assert all(card is not None for card in results.values())
+    assert [card.name for card in results.values()] == [f"Card {i}" for i in range(count)]
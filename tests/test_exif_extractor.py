@@ -0,0 +1,37 @@
+"""Tests for ExifExtractor."""
+
+import os
+
+import pytest
+
+from app.core.exif_extractor import ExifExtractor
+
+
+def test_findPngFilesRecursive(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.PNG").write_bytes(b"")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "c.png").write_bytes(b"")
+    
+    found = ExifExtractor.findPngFiles(str(tmp_path), recursive=True)
+    
+    root = os.path.realpath(tmp_path)
+    assert sorted(found) == sorted([os.path.join(root, "a.png"), os.path.join(root, "sub", "b.PNG")])
+    assert ExifExtractor.findPngFiles(str(tmp_path)) == [os.path.join(root, "a.png")]
+
+
+def test_findPngFilesSymlinkLoop(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.png").write_bytes(b"")
+    try:
+        (tmp_path / "sub" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks are not available")
+    
+    found = ExifExtractor.findPngFiles(str(tmp_path), recursive=True)
+    
+    root = os.path.realpath(tmp_path)
+    assert sorted(found) == sorted([os.path.join(root, "a.png"), os.path.join(root, "sub", "b.png")])